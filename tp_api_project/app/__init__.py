@@ -1,12 +1,19 @@
 """FastAPI application package for the Trustpilot take-home project."""
 
 __all__ = [
+    "admission",
+    "business_index",
+    "coalescing",
     "config",
     "db",
     "exceptions",
+    "ingest",
+    "inmemory",
     "logging_config",
     "main",
     "queries",
     "schemas",
+    "slow_query_log",
     "utils",
+    "warmup",
 ]
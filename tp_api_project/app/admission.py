@@ -0,0 +1,372 @@
+"""Admission control and load shedding in front of the query layer."""
+
+import asyncio
+import math
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from enum import IntEnum
+from itertools import count
+from typing import AbstractSet, Dict, List, NoReturn, Optional
+
+from starlette.requests import Request
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from .config import get_settings
+from .exceptions import AdmissionRejectedError
+from .logging_config import get_logger
+from .schemas import ErrorResponse
+
+logger = get_logger(__name__)
+
+_MAX_TRACKED_CLIENTS = 10_000
+
+
+class Priority(IntEnum):
+    """Scheduling classes; lower values are admitted first."""
+
+    INTERACTIVE = 0
+    BULK = 1
+
+
+@dataclass(slots=True)
+class _TokenBucket:
+    rate: float
+    capacity: float
+    tokens: float
+    updated_at: float
+
+    def take(self, now: float) -> float:
+        """Consume a token, returning 0 on success or the seconds until one is available."""
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return 0.0
+        return (1 - self.tokens) / self.rate
+
+
+@dataclass(slots=True)
+class _Waiter:
+    priority: Priority
+    sequence: int
+    client_key: str
+    future: "asyncio.Future[None]"
+    admitted: bool = False
+
+    @property
+    def rank(self) -> tuple[int, int]:
+        return (int(self.priority), self.sequence)
+
+
+@dataclass(slots=True)
+class _Stats:
+    admitted_total: int = 0
+    shed_total: Counter[str] = field(default_factory=Counter)
+
+
+class AdmissionController:
+    """Bound concurrent database work and shed excess load before it queues on the pool.
+
+    Requests beyond ``max_concurrency`` wait in a bounded priority queue until a slot is
+    released or their deadline passes. Each client key is additionally limited to
+    ``client_max_concurrency`` admitted-or-queued requests and a token-bucket rate of
+    ``client_rate`` requests per second. All state is touched from the event loop only.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int,
+        max_queue: int,
+        queue_timeout: float,
+        client_max_concurrency: int,
+        client_rate: float,
+        client_burst: int,
+    ) -> None:
+        self._max_concurrency = max_concurrency
+        self._max_queue = max_queue
+        self._queue_timeout = queue_timeout
+        self._client_max_concurrency = client_max_concurrency
+        self._client_rate = client_rate
+        self._client_burst = max(1, client_burst)
+        self._in_flight = 0
+        self._waiters: List[_Waiter] = []
+        self._client_active: Counter[str] = Counter()
+        self._buckets: Dict[str, _TokenBucket] = {}
+        self._sequence = count()
+        self._stats = _Stats()
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    @property
+    def queue_depth(self) -> int:
+        return len(self._waiters)
+
+    async def acquire(self, client_key: str, priority: Priority) -> None:
+        """Wait for an execution slot or raise ``AdmissionRejectedError``."""
+        self._check_rate(client_key)
+        if (
+            self._client_max_concurrency
+            and self._client_active[client_key] >= self._client_max_concurrency
+        ):
+            self._shed(
+                "client_concurrency",
+                "Too many concurrent requests for this client. Please retry shortly.",
+                status_code=429,
+                retry_after=1.0,
+            )
+
+        if self._in_flight < self._max_concurrency and not self._waiters:
+            self._admit(client_key)
+            return
+
+        # Waiters cancelled while queued stay listed until their own handler runs.
+        queued = [waiter for waiter in self._waiters if not waiter.future.done()]
+        if len(queued) >= self._max_queue:
+            victim = max(queued, key=lambda waiter: waiter.rank, default=None)
+            if victim is None or victim.priority <= priority:
+                self._shed(
+                    "queue_full",
+                    "The service is at capacity. Please retry shortly.",
+                    status_code=503,
+                    retry_after=self._queue_timeout,
+                )
+            self._abandon(victim)
+            self._stats.shed_total["preempted"] += 1
+            victim.future.set_exception(
+                AdmissionRejectedError(
+                    "The service is at capacity. Please retry shortly.",
+                    context={"reason": "preempted"},
+                    status_code=503,
+                    retry_after=self._queue_timeout,
+                )
+            )
+
+        waiter = _Waiter(
+            priority=priority,
+            sequence=next(self._sequence),
+            client_key=client_key,
+            future=asyncio.get_running_loop().create_future(),
+        )
+        self._waiters.append(waiter)
+        self._client_active[client_key] += 1
+        try:
+            await asyncio.wait_for(waiter.future, timeout=self._queue_timeout)
+        except asyncio.TimeoutError:
+            if waiter.admitted:
+                return
+            self._abandon(waiter)
+            self._shed(
+                "deadline",
+                "Timed out waiting for capacity. Please retry shortly.",
+                status_code=503,
+                retry_after=self._queue_timeout,
+            )
+        except asyncio.CancelledError:
+            if waiter.admitted:
+                self.release(client_key)
+            else:
+                self._abandon(waiter)
+            raise
+
+    def release(self, client_key: str) -> None:
+        """Return a slot and hand it to the highest-priority waiter, if any."""
+        self._in_flight = max(0, self._in_flight - 1)
+        self._forget_client(client_key)
+        while self._waiters and self._in_flight < self._max_concurrency:
+            waiter = min(self._waiters, key=lambda candidate: candidate.rank)
+            self._waiters.remove(waiter)
+            if waiter.future.done():
+                # Cancelled while queued; its own handler settles the bookkeeping.
+                continue
+            waiter.admitted = True
+            self._in_flight += 1
+            self._stats.admitted_total += 1
+            waiter.future.set_result(None)
+
+    def render_metrics(self) -> str:
+        """Render admission gauges and counters in the Prometheus text format."""
+        lines = [
+            "# HELP tp_api_admission_in_flight Requests currently admitted.",
+            "# TYPE tp_api_admission_in_flight gauge",
+            f"tp_api_admission_in_flight {self._in_flight}",
+            "# HELP tp_api_admission_queue_depth Requests waiting for admission.",
+            "# TYPE tp_api_admission_queue_depth gauge",
+            f"tp_api_admission_queue_depth {len(self._waiters)}",
+            "# HELP tp_api_admission_admitted_total Requests admitted.",
+            "# TYPE tp_api_admission_admitted_total counter",
+            f"tp_api_admission_admitted_total {self._stats.admitted_total}",
+            "# HELP tp_api_admission_shed_total Requests rejected by admission control.",
+            "# TYPE tp_api_admission_shed_total counter",
+        ]
+        for reason in ("rate_limited", "client_concurrency", "queue_full", "preempted", "deadline"):
+            lines.append(
+                f'tp_api_admission_shed_total{{reason="{reason}"}} '
+                f"{self._stats.shed_total[reason]}"
+            )
+        return "\n".join(lines) + "\n"
+
+    def _admit(self, client_key: str) -> None:
+        self._in_flight += 1
+        self._client_active[client_key] += 1
+        self._stats.admitted_total += 1
+
+    def _abandon(self, waiter: _Waiter) -> None:
+        if waiter in self._waiters:
+            self._waiters.remove(waiter)
+        self._forget_client(waiter.client_key)
+
+    def _forget_client(self, client_key: str) -> None:
+        self._client_active[client_key] -= 1
+        if self._client_active[client_key] <= 0:
+            del self._client_active[client_key]
+
+    def _check_rate(self, client_key: str) -> None:
+        if self._client_rate <= 0:
+            return
+        now = time.monotonic()
+        bucket = self._buckets.get(client_key)
+        if bucket is None:
+            if len(self._buckets) >= _MAX_TRACKED_CLIENTS:
+                self._prune_buckets(now)
+            bucket = _TokenBucket(
+                rate=self._client_rate,
+                capacity=self._client_burst,
+                tokens=self._client_burst,
+                updated_at=now,
+            )
+            self._buckets[client_key] = bucket
+        wait = bucket.take(now)
+        if wait > 0:
+            self._shed(
+                "rate_limited",
+                "Request rate limit exceeded for this client.",
+                status_code=429,
+                retry_after=wait,
+            )
+
+    def _prune_buckets(self, now: float) -> None:
+        """Forget clients whose buckets would have refilled completely."""
+        refill_seconds = self._client_burst / self._client_rate
+        stale = [
+            key
+            for key, bucket in self._buckets.items()
+            if now - bucket.updated_at >= refill_seconds
+        ]
+        for key in stale:
+            del self._buckets[key]
+
+    def _shed(self, reason: str, message: str, status_code: int, retry_after: float) -> NoReturn:
+        self._stats.shed_total[reason] += 1
+        raise AdmissionRejectedError(
+            message,
+            context={"reason": reason},
+            status_code=status_code,
+            retry_after=retry_after,
+        )
+
+
+def request_priority(request: Request) -> Priority:
+    """Classify paged review downloads and change-feed syncs as bulk, the rest as interactive."""
+    if request.url.path == "/reviews/changes":
+        return Priority.BULK
+    offset = request.query_params.get("offset", "0")
+    if request.url.path.startswith("/reviews/") and offset.strip() not in ("", "0"):
+        return Priority.BULK
+    return Priority.INTERACTIVE
+
+
+def client_key(request: Request, api_keys: AbstractSet[str]) -> str:
+    """Identify the caller by a configured API key, otherwise by remote address.
+
+    Unknown keys are ignored so a caller cannot escape its limits by inventing new ones.
+    """
+    api_key = request.headers.get("x-api-key")
+    if api_key and api_key in api_keys:
+        return f"key:{api_key}"
+    host = request.client.host if request.client else "unknown"
+    return f"addr:{host}"
+
+
+_CONTROLLER_CACHE: Dict[tuple, AdmissionController] = {}
+_CONTROLLER_LOCK = threading.Lock()
+
+
+def get_admission_controller() -> Optional[AdmissionController]:
+    """Return the process-wide admission controller, or ``None`` when disabled."""
+    settings = get_settings()
+    if not settings.admission_enabled:
+        return None
+
+    cache_key = (
+        settings.admission_max_concurrency,
+        settings.admission_queue_size,
+        settings.admission_queue_timeout,
+        settings.admission_client_max_concurrency,
+        settings.admission_client_rate,
+        settings.admission_client_burst,
+    )
+    with _CONTROLLER_LOCK:
+        controller = _CONTROLLER_CACHE.get(cache_key)
+        if controller is None:
+            controller = AdmissionController(
+                max_concurrency=settings.admission_max_concurrency,
+                max_queue=settings.admission_queue_size,
+                queue_timeout=settings.admission_queue_timeout,
+                client_max_concurrency=settings.admission_client_max_concurrency,
+                client_rate=settings.admission_client_rate,
+                client_burst=settings.admission_client_burst,
+            )
+            _CONTROLLER_CACHE[cache_key] = controller
+    return controller
+
+
+class AdmissionMiddleware:
+    """ASGI middleware that holds an admission slot for the full lifetime of a response.
+
+    Waiting happens on the event loop, so queued requests do not occupy threadpool
+    workers, and the slot is only released once the streamed body has been sent. Only
+    the lookups that hold a pooled connection are admitted: ``POST /reviews`` waits on the
+    ingestion writer and ``/businesses`` is answered from the in-process index.
+    """
+
+    def __init__(self, app: ASGIApp, path_prefixes: tuple[str, ...] = ("/reviews/", "/users/")):
+        self.app = app
+        self._path_prefixes = path_prefixes
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not scope["path"].startswith(self._path_prefixes):
+            await self.app(scope, receive, send)
+            return
+
+        controller = get_admission_controller()
+        if controller is None:
+            await self.app(scope, receive, send)
+            return
+
+        request = Request(scope)
+        key = client_key(request, get_settings().admission_client_api_keys)
+        try:
+            await controller.acquire(key, request_priority(request))
+        except AdmissionRejectedError as exc:
+            context = dict(exc.context or {})
+            context.setdefault("path", str(request.url))
+            logger.warning("Request shed by admission control", extra={"context": context})
+            response = JSONResponse(
+                status_code=exc.status_code,
+                content=ErrorResponse(detail=exc.message, context=context).model_dump(
+                    exclude_none=True
+                ),
+                headers={"Retry-After": str(max(1, math.ceil(exc.retry_after)))},
+            )
+            await response(scope, receive, send)
+            return
+
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            controller.release(key)
@@ -0,0 +1,139 @@
+"""Sorted in-process index over ``dim_business`` for business name prefix lookups."""
+
+import heapq
+import re
+import threading
+import time
+import unicodedata
+from bisect import bisect_left
+from typing import Any, Dict, List, Sequence, Tuple
+
+from .config import get_settings
+from .db import get_connection, qualify_table
+from .logging_config import get_logger
+
+Row = Tuple[Any, ...]
+QueryResult = Tuple[List[Row], List[str]]
+
+logger = get_logger(__name__)
+
+MAX_RESULTS = 50
+_HEADER = ["business_id", "business_name", "review_count"]
+# Unicode ``\W`` plus ``_`` is everything but letters and digits, like ``[^\p{L}\p{N}]`` in SQL.
+_SEPARATORS = re.compile(r"[\W_]+")
+# Prefixes matching more names than this get their ranking precomputed at load time, which
+# bounds the range any lookup has to rank on the fly.
+_PRECOMPUTE_THRESHOLD = 1000
+_KEY_CEILING = "\U0010ffff"
+
+
+def normalize_name(value: str) -> str:
+    """Match the dbt ``name_key`` macro: ``lower(strip_accents(...))`` and separator collapsing.
+
+    DuckDB strips every mark from the canonical decomposition and recomposes, and lowercases
+    one code point at a time, so ``str.lower``'s final-sigma rule is avoided.
+    """
+    decomposed = unicodedata.normalize("NFD", value)
+    stripped = "".join(
+        char for char in decomposed if not unicodedata.category(char).startswith("M")
+    )
+    lowered = unicodedata.normalize("NFC", "".join(char.lower() for char in stripped))
+    return _SEPARATORS.sub(" ", lowered).strip()
+
+
+class BusinessIndex:
+    """Answer prefix lookups with a binary search over name keys sorted at load time.
+
+    A lookup bisects to the contiguous range of keys sharing the prefix and keeps the
+    ``limit`` businesses with the most reviews. Every prefix whose range holds more than
+    ``precompute_threshold`` keys has its ranking computed once up front, so no lookup
+    ranks more than that many rows.
+    """
+
+    def __init__(
+        self,
+        rows: Sequence[Tuple[str, str | None, str, int]],
+        precompute_threshold: int = _PRECOMPUTE_THRESHOLD,
+    ) -> None:
+        ordered = sorted(rows, key=lambda row: (row[2], -row[3], row[0]))
+        self._keys = [row[2] for row in ordered]
+        self._rows: List[Row] = [(row[0], row[1], row[3]) for row in ordered]
+        self._top_by_prefix: Dict[str, List[Row]] = {}
+
+        # Walk the implicit trie of key prefixes, descending only into wide ranges. Ranges
+        # at one depth are disjoint, so this touches each key once per precomputed depth.
+        wide_ranges = [("", 0, len(self._keys))]
+        while wide_ranges:
+            prefix, start, end = wide_ranges.pop()
+            if end - start <= precompute_threshold:
+                continue
+            if prefix:
+                self._top_by_prefix[prefix] = self._top(range(start, end), MAX_RESULTS)
+            depth = len(prefix)
+            position = start
+            while position < end:
+                if len(self._keys[position]) == depth:
+                    position += 1
+                    continue
+                child = self._keys[position][: depth + 1]
+                child_end = bisect_left(self._keys, child + _KEY_CEILING, position, end)
+                wide_ranges.append((child, position, child_end))
+                position = child_end
+
+    @classmethod
+    def load(cls, table_name: str = "dim_business") -> "BusinessIndex":
+        """Read the business dimension through the DuckDB pool and index it."""
+        started = time.perf_counter()
+        with get_connection() as connection:
+            table_ref = qualify_table(connection, table_name)
+            rows = connection.execute(
+                "select business_id, business_name, name_key, review_count "
+                f"from {table_ref} where name_key is not null"
+            ).fetchall()
+        index = cls(rows)
+        logger.info(
+            "Loaded business index",
+            extra={
+                "context": {
+                    "businesses": len(rows),
+                    "duration_ms": round((time.perf_counter() - started) * 1000, 2),
+                }
+            },
+        )
+        return index
+
+    @property
+    def size(self) -> int:
+        return len(self._keys)
+
+    def search(self, prefix: str, limit: int) -> QueryResult:
+        """Return up to ``limit`` businesses whose name starts with ``prefix``, by review count."""
+        key = normalize_name(prefix)
+        if not key:
+            return [], list(_HEADER)
+        precomputed = self._top_by_prefix.get(key)
+        if precomputed is not None:
+            return precomputed[:limit], list(_HEADER)
+        start = bisect_left(self._keys, key)
+        end = bisect_left(self._keys, key + _KEY_CEILING, lo=start)
+        return self._top(range(start, end), limit), list(_HEADER)
+
+    def _top(self, positions: Sequence[int], limit: int) -> List[Row]:
+        ranked = heapq.nsmallest(limit, positions, key=lambda i: (-self._rows[i][2], i))
+        return [self._rows[i] for i in ranked]
+
+
+_INDEX_CACHE: Dict[tuple, BusinessIndex] = {}
+_INDEX_LOCK = threading.Lock()
+
+
+def get_business_index() -> BusinessIndex:
+    """Return the process-wide business index, loading it on first use."""
+    settings = get_settings()
+    cache_key = (settings.duckdb_path, settings.duckdb_schema)
+    with _INDEX_LOCK:
+        index = _INDEX_CACHE.get(cache_key)
+        if index is None:
+            index = BusinessIndex.load()
+            _INDEX_CACHE[cache_key] = index
+    return index
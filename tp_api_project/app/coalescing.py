@@ -0,0 +1,325 @@
+"""Single-flight coalescing for identical concurrent read queries."""
+
+import copy
+import dataclasses
+import threading
+from functools import partial
+from itertools import count, islice
+from typing import Any, Callable, Dict, Hashable, Iterator, List, Optional, Sequence, Tuple
+
+from .config import get_settings
+from .exceptions import DataAccessError
+from .logging_config import get_logger
+
+Row = Tuple[Any, ...]
+QueryResult = Tuple[Iterator[Row], List[str]]
+
+logger = get_logger(__name__)
+
+
+def _copy_error(error: BaseException) -> BaseException:
+    """Return a fresh copy of ``error`` so each follower raises with its own traceback."""
+    if isinstance(error, DataAccessError):
+        # ``copy.copy`` drops slotted dataclass fields such as ``status_code``.
+        return dataclasses.replace(error)
+    return copy.copy(error)
+
+
+class _Flight:
+    """Shared state for one in-flight query and the subscribers reading it.
+
+    Batches are pulled from the source iterator by whichever subscriber runs out of
+    buffered rows first, so no extra thread is needed. The buffer only keeps batches
+    that at least one subscriber still has to read and is capped at
+    ``max_buffered_batches``; a subscriber lagging behind that window for longer than
+    ``timeout`` is evicted so it cannot stall the others.
+    """
+
+    def __init__(
+        self,
+        batch_size: int,
+        max_buffered_batches: int,
+        timeout: float,
+        on_retire: Callable[["_Flight"], None],
+    ) -> None:
+        self._batch_size = batch_size
+        self._max_buffered_batches = max_buffered_batches
+        self._timeout = timeout
+        self._on_retire = on_retire
+        self._cond = threading.Condition()
+        self._ids = count()
+        self._source: Optional[Iterator[Row]] = None
+        self._header: List[str] = []
+        self._ready = False
+        self._error: Optional[BaseException] = None
+        self._batches: List[List[Row]] = []
+        self._base = 0
+        self._exhausted = False
+        self._fetching = False
+        self._retired = False
+        self._cursors: Dict[int, int] = {}
+        self._evicted: set[int] = set()
+
+    @property
+    def header(self) -> List[str]:
+        return list(self._header)
+
+    def try_attach(self) -> Optional[int]:
+        """Register a subscriber if the result can still be replayed from its first row."""
+        with self._cond:
+            if self._retired or self._error is not None or self._base != 0:
+                return None
+            subscriber_id = next(self._ids)
+            self._cursors[subscriber_id] = 0
+            return subscriber_id
+
+    def start(self, rows: Iterator[Row], header: Sequence[str]) -> None:
+        """Publish the leader's result so waiting followers can start streaming."""
+        with self._cond:
+            self._source = rows
+            self._header = list(header)
+            self._ready = True
+            self._cond.notify_all()
+
+    def fail(self, exc: BaseException) -> None:
+        """Propagate the leader's failure to every follower and retire the flight."""
+        with self._cond:
+            self._error = exc
+            self._ready = True
+            self._retired = True
+            self._cursors.clear()
+            self._cond.notify_all()
+        self._on_retire(self)
+
+    def wait_ready(self, subscriber_id: int) -> None:
+        """Block a follower until the leader has executed the query."""
+        with self._cond:
+            if not self._cond.wait_for(lambda: self._ready, timeout=self._timeout):
+                self._cursors.pop(subscriber_id, None)
+                raise DataAccessError(
+                    "Timed out waiting for an identical in-flight query to complete.",
+                    context={"timeout": self._timeout},
+                    status_code=503,
+                )
+            if self._error is not None:
+                raise _copy_error(self._error) from self._error
+
+    def next_batch(self, subscriber_id: int) -> Optional[List[Row]]:
+        """Return the next batch for ``subscriber_id`` or ``None`` once the result is drained."""
+        while True:
+            with self._cond:
+                while True:
+                    if subscriber_id in self._evicted:
+                        # The response headers are already sent by now, so this ends the
+                        # stream early rather than turning into a 503.
+                        raise DataAccessError(
+                            "The response stream fell too far behind and was cut off.",
+                            context={"max_buffered_batches": self._max_buffered_batches},
+                            status_code=503,
+                        )
+                    position = self._cursors[subscriber_id]
+                    if position < self._base + len(self._batches):
+                        batch = self._batches[position - self._base]
+                        self._cursors[subscriber_id] = position + 1
+                        self._trim()
+                        return batch
+                    if self._error is not None:
+                        raise _copy_error(self._error) from self._error
+                    if self._exhausted:
+                        return None
+                    if not self._fetching:
+                        if len(self._batches) < self._max_buffered_batches:
+                            self._fetching = True
+                            break
+                        if not self._cond.wait(timeout=self._timeout):
+                            self._evict_laggards()
+                        continue
+                    self._cond.wait()
+
+            source = self._source
+            assert source is not None
+            try:
+                batch = list(islice(source, self._batch_size))
+            except BaseException as exc:
+                with self._cond:
+                    self._error = exc
+                    self._fetching = False
+                    self._cond.notify_all()
+                raise
+
+            with self._cond:
+                self._fetching = False
+                if batch:
+                    self._batches.append(batch)
+                else:
+                    self._exhausted = True
+                    self._source = None
+                self._cond.notify_all()
+
+    def detach(self, subscriber_id: int) -> None:
+        """Drop a subscriber; the last one out releases the underlying cursor."""
+        source: Optional[Iterator[Row]] = None
+        retire = False
+        with self._cond:
+            self._cursors.pop(subscriber_id, None)
+            self._evicted.discard(subscriber_id)
+            if self._cursors:
+                self._trim()
+                self._cond.notify_all()
+                return
+            if not self._retired:
+                self._retired = True
+                retire = True
+            if not self._fetching:
+                source, self._source = self._source, None
+            self._batches.clear()
+        if source is not None:
+            close = getattr(source, "close", None)
+            if callable(close):
+                close()
+        if retire:
+            self._on_retire(self)
+
+    def _trim(self) -> None:
+        """Drop batches every live subscriber has already consumed."""
+        if not self._cursors:
+            return
+        lowest = min(self._cursors.values())
+        drop = lowest - self._base
+        if drop > 0:
+            del self._batches[:drop]
+            self._base = lowest
+            self._cond.notify_all()
+
+    def _evict_laggards(self) -> None:
+        """Evict subscribers still pinning the oldest buffered batch."""
+        laggards = [sid for sid, position in self._cursors.items() if position == self._base]
+        for subscriber_id in laggards:
+            self._cursors.pop(subscriber_id)
+            self._evicted.add(subscriber_id)
+        if laggards:
+            logger.warning(
+                "Evicted slow coalesced subscribers",
+                extra={"context": {"count": len(laggards)}},
+            )
+        self._trim()
+
+
+class _Subscription:
+    """Row iterator handed to each caller sharing a flight."""
+
+    def __init__(self, flight: _Flight, subscriber_id: int) -> None:
+        self._flight = flight
+        self._subscriber_id = subscriber_id
+        self._batch: List[Row] = []
+        self._index = 0
+        self._closed = False
+
+    def __iter__(self) -> "_Subscription":
+        return self
+
+    def __next__(self) -> Row:
+        if self._closed:
+            raise StopIteration
+        while self._index >= len(self._batch):
+            try:
+                batch = self._flight.next_batch(self._subscriber_id)
+            except BaseException:
+                self.close()
+                raise
+            if batch is None:
+                self.close()
+                raise StopIteration
+            self._batch = batch
+            self._index = 0
+        row = self._batch[self._index]
+        self._index += 1
+        return row
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        self._batch = []
+        self._flight.detach(self._subscriber_id)
+
+    def __del__(self) -> None:
+        self.close()
+
+
+class SingleFlight:
+    """Collapse identical concurrent queries onto a single database execution.
+
+    The first caller for a key becomes the leader and runs the query; callers arriving
+    while the leader's result can still be replayed from its first row become followers
+    and receive the same batches without taking a pool connection.
+    """
+
+    def __init__(self, batch_size: int, max_buffered_batches: int, timeout: float) -> None:
+        self._batch_size = batch_size
+        self._max_buffered_batches = max_buffered_batches
+        self._timeout = timeout
+        # Re-entrant because subscriptions may be finalised by the garbage collector
+        # while this thread already holds the lock.
+        self._lock = threading.RLock()
+        self._flights: Dict[Hashable, _Flight] = {}
+
+    def do(self, key: Hashable, fn: Callable[[], Tuple[Any, List[str]]]) -> QueryResult:
+        """Run ``fn`` once per burst of identical ``key`` requests and share its rows."""
+        with self._lock:
+            flight = self._flights.get(key)
+            subscriber_id = flight.try_attach() if flight is not None else None
+            leader = flight is None or subscriber_id is None
+            if leader:
+                flight = _Flight(
+                    batch_size=self._batch_size,
+                    max_buffered_batches=self._max_buffered_batches,
+                    timeout=self._timeout,
+                    on_retire=partial(self._retire, key),
+                )
+                self._flights[key] = flight
+                subscriber_id = flight.try_attach()
+            assert flight is not None and subscriber_id is not None
+
+        if leader:
+            try:
+                rows, header = fn()
+            except BaseException as exc:
+                flight.fail(exc)
+                raise
+            flight.start(iter(rows), header)
+        else:
+            flight.wait_ready(subscriber_id)
+        return _Subscription(flight, subscriber_id), flight.header
+
+    def _retire(self, key: Hashable, flight: _Flight) -> None:
+        with self._lock:
+            if self._flights.get(key) is flight:
+                del self._flights[key]
+
+
+_SINGLE_FLIGHT_CACHE: Dict[tuple, SingleFlight] = {}
+_SINGLE_FLIGHT_LOCK = threading.Lock()
+
+
+def get_single_flight(batch_size: int) -> Optional[SingleFlight]:
+    """Return the process-wide coalescer, or ``None`` when coalescing is disabled."""
+    settings = get_settings()
+    if not settings.coalesce_requests:
+        return None
+
+    cache_key = (
+        batch_size,
+        settings.coalesce_max_buffered_batches,
+        settings.coalesce_timeout,
+    )
+    with _SINGLE_FLIGHT_LOCK:
+        single_flight = _SINGLE_FLIGHT_CACHE.get(cache_key)
+        if single_flight is None:
+            single_flight = SingleFlight(
+                batch_size=batch_size,
+                max_buffered_batches=settings.coalesce_max_buffered_batches,
+                timeout=settings.coalesce_timeout,
+            )
+            _SINGLE_FLIGHT_CACHE[cache_key] = single_flight
+    return single_flight
@@ -14,6 +14,12 @@ _DEFAULT_SCHEMAS: dict[str, str | None] = {
     "prod": None,
 }
 
+# Touches the filter and sort columns used by every review endpoint.
+_DEFAULT_WARMUP_QUERIES: tuple[str, ...] = (
+    "select count(distinct business_id), count(distinct reviewer_id), max(review_date) "
+    "from {crt_tp_reviews}",
+)
+
 
 def _to_bool(value: str | None, default: bool) -> bool:
     if value is None:
@@ -52,6 +58,29 @@ class Settings(BaseModel):
     database_backend: str = "duckdb"
     connection_pool_size: int = Field(default=5, ge=1)
     connection_pool_timeout: float = Field(default=5.0, gt=0)
+    connection_pool_min_size: int = Field(default=1, ge=0)
+    warmup_enabled: bool = True
+    warmup_queries: tuple[str, ...] = _DEFAULT_WARMUP_QUERIES
+    coalesce_requests: bool = True
+    coalesce_max_buffered_batches: int = Field(default=16, ge=1)
+    coalesce_timeout: float = Field(default=10.0, gt=0)
+    slow_query_threshold_ms: float = Field(default=250.0, ge=0)
+    slow_query_sample_rate: float = Field(default=0.0, ge=0, le=1)
+    slow_query_log_size: int = Field(default=200, ge=1)
+    debug_token: str | None = Field(default=None, repr=False)
+    admission_enabled: bool = True
+    admission_max_concurrency: int = Field(default=5, ge=1)
+    admission_queue_size: int = Field(default=64, ge=0)
+    admission_queue_timeout: float = Field(default=1.0, gt=0)
+    admission_client_max_concurrency: int = Field(default=0, ge=0)
+    admission_client_rate: float = Field(default=0.0, ge=0)
+    admission_client_burst: int = Field(default=40, ge=1)
+    admission_client_api_keys: frozenset[str] = Field(default=frozenset(), repr=False)
+    ingest_enabled: bool = False
+    ingest_batch_size: int = Field(default=500, ge=1)
+    ingest_flush_interval: float = Field(default=0.2, gt=0)
+    ingest_max_buffered_rows: int = Field(default=10000, ge=1)
+    ingest_wait_timeout: float = Field(default=5.0, gt=0)
 
     model_config = ConfigDict(frozen=True)
 
@@ -86,6 +115,59 @@ def get_settings() -> Settings:
 
     pool_size = max(1, _to_int(os.getenv("TP_API_DB_POOL_SIZE"), 5))
     pool_timeout = max(0.1, _to_float(os.getenv("TP_API_DB_POOL_TIMEOUT"), 5.0))
+    pool_min_size = min(pool_size, max(0, _to_int(os.getenv("TP_API_DB_POOL_MIN_SIZE"), 1)))
+
+    warmup_enabled = _to_bool(os.getenv("TP_API_WARMUP_ENABLED"), default=True)
+    raw_warmup_queries = os.getenv("TP_API_WARMUP_QUERIES")
+    if raw_warmup_queries is None:
+        warmup_queries = _DEFAULT_WARMUP_QUERIES
+    else:
+        warmup_queries = tuple(
+            query.strip() for query in raw_warmup_queries.split(";") if query.strip()
+        )
+
+    coalesce_requests = _to_bool(os.getenv("TP_API_COALESCE_REQUESTS"), default=True)
+    coalesce_max_buffered_batches = max(
+        1, _to_int(os.getenv("TP_API_COALESCE_MAX_BUFFERED_BATCHES"), 16)
+    )
+    coalesce_timeout = max(0.1, _to_float(os.getenv("TP_API_COALESCE_TIMEOUT"), 10.0))
+
+    slow_query_threshold_ms = max(0.0, _to_float(os.getenv("TP_API_SLOW_QUERY_MS"), 250.0))
+    slow_query_sample_rate = min(
+        1.0, max(0.0, _to_float(os.getenv("TP_API_SLOW_QUERY_SAMPLE_RATE"), 0.0))
+    )
+    slow_query_log_size = max(1, _to_int(os.getenv("TP_API_SLOW_QUERY_LOG_SIZE"), 200))
+    raw_debug_token = os.getenv("TP_API_DEBUG_TOKEN")
+    debug_token = raw_debug_token.strip() if raw_debug_token and raw_debug_token.strip() else None
+
+    # Admit no more requests than there are connections, so excess load waits in the
+    # admission queue with a deadline instead of blocking threadpool workers in the pool.
+    admission_enabled = _to_bool(os.getenv("TP_API_ADMISSION_ENABLED"), default=True)
+    admission_max_concurrency = max(
+        1, _to_int(os.getenv("TP_API_ADMISSION_MAX_CONCURRENCY"), pool_size)
+    )
+    admission_queue_size = max(0, _to_int(os.getenv("TP_API_ADMISSION_QUEUE_SIZE"), 64))
+    admission_queue_timeout = max(0.05, _to_float(os.getenv("TP_API_ADMISSION_QUEUE_TIMEOUT"), 1.0))
+    # Per-client limits are opt-in: behind a proxy every caller shares one address unless
+    # uvicorn is told to trust its forwarded headers.
+    admission_client_max_concurrency = max(
+        0, _to_int(os.getenv("TP_API_ADMISSION_CLIENT_MAX_CONCURRENCY"), 0)
+    )
+    admission_client_rate = max(0.0, _to_float(os.getenv("TP_API_ADMISSION_CLIENT_RATE"), 0.0))
+    admission_client_burst = max(1, _to_int(os.getenv("TP_API_ADMISSION_CLIENT_BURST"), 40))
+    admission_client_api_keys = frozenset(
+        key.strip()
+        for key in os.getenv("TP_API_ADMISSION_CLIENT_API_KEYS", "").split(",")
+        if key.strip()
+    )
+
+    ingest_enabled = _to_bool(os.getenv("TP_API_INGEST_ENABLED"), default=False)
+    ingest_batch_size = max(1, _to_int(os.getenv("TP_API_INGEST_BATCH_SIZE"), 500))
+    ingest_flush_interval = max(0.001, _to_float(os.getenv("TP_API_INGEST_FLUSH_INTERVAL"), 0.2))
+    ingest_max_buffered_rows = max(
+        ingest_batch_size, _to_int(os.getenv("TP_API_INGEST_MAX_BUFFERED_ROWS"), 10000)
+    )
+    ingest_wait_timeout = max(0.1, _to_float(os.getenv("TP_API_INGEST_WAIT_TIMEOUT"), 5.0))
 
     return Settings(
         environment=environment,
@@ -95,4 +177,27 @@ def get_settings() -> Settings:
         database_backend=database_backend,
         connection_pool_size=pool_size,
         connection_pool_timeout=pool_timeout,
+        connection_pool_min_size=pool_min_size,
+        warmup_enabled=warmup_enabled,
+        warmup_queries=warmup_queries,
+        coalesce_requests=coalesce_requests,
+        coalesce_max_buffered_batches=coalesce_max_buffered_batches,
+        coalesce_timeout=coalesce_timeout,
+        slow_query_threshold_ms=slow_query_threshold_ms,
+        slow_query_sample_rate=slow_query_sample_rate,
+        slow_query_log_size=slow_query_log_size,
+        debug_token=debug_token,
+        admission_enabled=admission_enabled,
+        admission_max_concurrency=admission_max_concurrency,
+        admission_queue_size=admission_queue_size,
+        admission_queue_timeout=admission_queue_timeout,
+        admission_client_max_concurrency=admission_client_max_concurrency,
+        admission_client_rate=admission_client_rate,
+        admission_client_burst=admission_client_burst,
+        admission_client_api_keys=admission_client_api_keys,
+        ingest_enabled=ingest_enabled,
+        ingest_batch_size=ingest_batch_size,
+        ingest_flush_interval=ingest_flush_interval,
+        ingest_max_buffered_rows=ingest_max_buffered_rows,
+        ingest_wait_timeout=ingest_wait_timeout,
     )
@@ -31,6 +31,8 @@ class DuckDBConnectionPool:
         self._timeout = timeout
         self._lock = threading.Lock()
         self._active_connections = 0
+        self._probe_lock = threading.Lock()
+        self._probe_connection: Optional[DuckDBPyConnection] = None
 
     def _initialize_connection(self) -> DuckDBPyConnection:
         """Open a new DuckDB connection respecting the configured schema."""
@@ -43,6 +45,28 @@ class DuckDBConnectionPool:
             connection.execute(f"SET schema '{sanitized_schema}'")
         return connection
 
+    def prefill(self, count: int) -> int:
+        """Eagerly open up to ``count`` idle connections and return how many were added."""
+        opened = 0
+        with self._lock:
+            while self._active_connections < min(count, self._queue.maxsize):
+                self._queue.put_nowait(self._initialize_connection())
+                self._active_connections += 1
+                opened += 1
+        return opened
+
+    def ping(self) -> None:
+        """Run a trivial query on a dedicated connection so probes never wait on the pool."""
+        with self._probe_lock:
+            if self._probe_connection is None:
+                self._probe_connection = self._initialize_connection()
+            try:
+                self._probe_connection.execute("select 1").fetchone()
+            except duckdb.Error:
+                self._probe_connection.close()
+                self._probe_connection = None
+                raise
+
     @contextmanager
     def acquire(self) -> Iterator[DuckDBPyConnection]:
         """Yield a pooled connection, blocking up to the configured timeout."""
@@ -89,11 +113,11 @@ def _quote_identifier(identifier: str) -> str:
     return f'"{identifier.replace("\"", "\"\"")}"'
 
 
-@contextmanager
-def get_connection() -> Iterator[DuckDBPyConnection]:
-    """Obtain a pooled DuckDB connection based on application settings."""
+def get_pool() -> DuckDBConnectionPool:
+    """Return the process-wide connection pool for the current settings."""
     settings = get_settings()
-    if settings.database_backend != "duckdb":
+    # The in-memory backend is loaded from the same DuckDB file, so it shares the pool.
+    if settings.database_backend not in ("duckdb", "inmemory"):
         raise NotImplementedError(f"Unsupported database backend '{settings.database_backend}'.")
 
     cache_key = (
@@ -115,8 +139,13 @@ def get_connection() -> Iterator[DuckDBPyConnection]:
                 timeout=settings.connection_pool_timeout,
             )
             _POOL_CACHE[cache_key] = pool
+    return pool
 
-    with pool.acquire() as connection:
+
+@contextmanager
+def get_connection() -> Iterator[DuckDBPyConnection]:
+    """Obtain a pooled DuckDB connection based on application settings."""
+    with get_pool().acquire() as connection:
         yield connection
 
 
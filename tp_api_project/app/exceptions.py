@@ -22,3 +22,11 @@ class RecordNotFoundError(DataAccessError):
     """Raised when no rows match the supplied filters."""
 
     status_code: int = 404
+
+
+@dataclass(slots=True)
+class AdmissionRejectedError(DataAccessError):
+    """Raised when admission control sheds a request before it reaches the database."""
+
+    status_code: int = 503
+    retry_after: float = 1.0
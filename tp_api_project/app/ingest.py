@@ -0,0 +1,275 @@
+"""Micro-batched review ingestion with group commits into the landing table."""
+
+import threading
+import time
+import uuid
+from collections import deque
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from typing import Any, Deque, Dict, List, Optional, Sequence
+
+import duckdb
+import pyarrow as pa
+
+from .config import get_settings
+from .exceptions import DataAccessError
+from .logging_config import get_logger
+from .schemas import ReviewIn
+
+logger = get_logger(__name__)
+
+LANDING_SCHEMA = "LANDING"
+LANDING_TABLE = "lnd_tp_reviews"
+_LANDING_REF = f'"{LANDING_SCHEMA}"."{LANDING_TABLE}"'
+
+# Mirrors the ``crt_tp_reviews`` contract; keep in sync with the dbt ``create_landing_tables``
+# macro, which creates the same table before every dbt run.
+_REVIEW_SCHEMA = pa.schema(
+    [
+        pa.field("review_id", pa.string(), nullable=False),
+        pa.field("reviewer_id", pa.string(), nullable=False),
+        pa.field("business_id", pa.string(), nullable=False),
+        pa.field("reviewer_name", pa.string()),
+        pa.field("business_name", pa.string()),
+        pa.field("review_title", pa.string()),
+        pa.field("review_content", pa.string()),
+        pa.field("review_rating", pa.int32()),
+        pa.field("review_ip_address", pa.string()),
+        pa.field("email_address", pa.string()),
+        pa.field("reviewer_country", pa.string()),
+        pa.field("review_date", pa.date32(), nullable=False),
+    ]
+)
+_COLUMNS = ", ".join(_REVIEW_SCHEMA.names)
+
+_CREATE_LANDING_TABLE = f"""
+create table if not exists {_LANDING_REF} (
+    review_id varchar not null,
+    reviewer_id varchar not null,
+    business_id varchar not null,
+    reviewer_name varchar,
+    business_name varchar,
+    review_title varchar,
+    review_content varchar,
+    review_rating integer,
+    review_ip_address varchar,
+    email_address varchar,
+    reviewer_country varchar,
+    review_date date not null,
+    batch_id varchar not null,
+    ingested_at timestamptz not null
+)
+"""
+
+_INSERT_BATCH = f"""
+insert into {_LANDING_REF} ({_COLUMNS}, batch_id, ingested_at)
+select {_COLUMNS}, ?, current_timestamp from ingest_batch
+"""
+
+
+@dataclass(slots=True)
+class _Submission:
+    rows: List[Dict[str, Any]]
+    committed: "Future[str]"
+    enqueued_at: float = field(default_factory=time.monotonic)
+
+
+class ReviewIngestor:
+    """Buffer submitted reviews and append them to the landing table in group commits.
+
+    A single writer thread owns a dedicated DuckDB connection. It flushes once the
+    buffer holds ``batch_size`` rows or its oldest row has waited ``flush_interval``
+    seconds, appending up to ``batch_size`` rows as one Arrow table in one transaction.
+    Reviews from one request always land in the same batch, so a batch can overshoot
+    ``batch_size`` by at most one request.
+    """
+
+    def __init__(
+        self,
+        database_path: str,
+        batch_size: int,
+        flush_interval: float,
+        max_buffered_rows: int,
+    ) -> None:
+        self._batch_size = batch_size
+        self._flush_interval = flush_interval
+        self._max_buffered_rows = max_buffered_rows
+        self._cond = threading.Condition()
+        self._pending: Deque[_Submission] = deque()
+        self._buffered_rows = 0
+        self._closing = False
+        self.committed_rows = 0
+        self.committed_batches = 0
+        self.failed_rows = 0
+
+        self._connection = duckdb.connect(database_path, read_only=False)
+        self._connection.execute(f'create schema if not exists "{LANDING_SCHEMA}"')
+        self._connection.execute(_CREATE_LANDING_TABLE)
+        self._thread = threading.Thread(target=self._run, name="tp-api-ingest", daemon=True)
+        self._thread.start()
+
+    @property
+    def buffered_rows(self) -> int:
+        with self._cond:
+            return self._buffered_rows
+
+    def submit(self, reviews: Sequence[ReviewIn]) -> "Future[str]":
+        """Buffer ``reviews`` and return a future resolved with the committing batch id."""
+        rows = [review.model_dump() for review in reviews]
+        future: Future[str] = Future()
+        # A running future cannot be cancelled, so a caller that stops waiting does not
+        # make the writer's ``set_result`` fail.
+        future.set_running_or_notify_cancel()
+        with self._cond:
+            if self._closing:
+                raise DataAccessError("Review ingestion is shutting down.", status_code=503)
+            if self._buffered_rows + len(rows) > self._max_buffered_rows:
+                raise DataAccessError(
+                    "The ingestion buffer is full. Please retry shortly.",
+                    context={"buffered_rows": self._buffered_rows},
+                    status_code=503,
+                )
+            self._pending.append(_Submission(rows, future))
+            self._buffered_rows += len(rows)
+            self._cond.notify()
+        return future
+
+    def close(self, timeout: float | None = None) -> None:
+        """Flush whatever is buffered, stop the writer thread and close its connection."""
+        with self._cond:
+            self._closing = True
+            self._cond.notify()
+        self._thread.join(timeout)
+        if not self._thread.is_alive():
+            self._connection.close()
+
+    def _flush_due(self) -> bool:
+        if self._closing or self._buffered_rows >= self._batch_size:
+            return True
+        return bool(self._pending) and (
+            time.monotonic() - self._pending[0].enqueued_at >= self._flush_interval
+        )
+
+    def _take_batch(self) -> List[_Submission]:
+        batch: List[_Submission] = []
+        rows = 0
+        while self._pending and rows < self._batch_size:
+            submission = self._pending.popleft()
+            batch.append(submission)
+            rows += len(submission.rows)
+        self._buffered_rows -= rows
+        return batch
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while not self._flush_due():
+                    timeout = None
+                    if self._pending:
+                        timeout = (
+                            self._pending[0].enqueued_at + self._flush_interval - time.monotonic()
+                        )
+                    self._cond.wait(timeout)
+                batch = self._take_batch()
+                done = self._closing and not self._pending
+            if batch:
+                self._flush(batch)
+            if done:
+                return
+
+    def _flush(self, submissions: List[_Submission]) -> None:
+        rows = [row for submission in submissions for row in submission.rows]
+        batch_id = uuid.uuid4().hex
+        started = time.perf_counter()
+        try:
+            batch = pa.Table.from_pylist(rows, schema=_REVIEW_SCHEMA)
+            self._connection.begin()
+            try:
+                self._connection.register("ingest_batch", batch)
+                self._connection.execute(_INSERT_BATCH, [batch_id])
+                self._connection.commit()
+            except duckdb.Error:
+                self._connection.rollback()
+                raise
+            finally:
+                self._connection.unregister("ingest_batch")
+        except (duckdb.Error, pa.ArrowException) as exc:
+            self.failed_rows += len(rows)
+            logger.exception(
+                "Failed to commit ingestion batch",
+                extra={"context": {"batch_id": batch_id, "rows": len(rows)}},
+            )
+            error = DataAccessError(
+                "Failed to store the submitted reviews.",
+                context={"batch_id": batch_id},
+            )
+            error.__cause__ = exc
+            for submission in submissions:
+                submission.committed.set_exception(error)
+            return
+
+        self.committed_rows += len(rows)
+        self.committed_batches += 1
+        logger.debug(
+            "Committed ingestion batch",
+            extra={
+                "context": {
+                    "batch_id": batch_id,
+                    "rows": len(rows),
+                    "requests": len(submissions),
+                    "duration_ms": round((time.perf_counter() - started) * 1000, 2),
+                }
+            },
+        )
+        for submission in submissions:
+            submission.committed.set_result(batch_id)
+
+
+_INGESTOR_CACHE: Dict[tuple, ReviewIngestor] = {}
+_INGESTOR_LOCK = threading.Lock()
+
+
+def get_ingestor() -> Optional[ReviewIngestor]:
+    """Return the process-wide ingestor, or ``None`` when write mode is disabled."""
+    settings = get_settings()
+    if not settings.ingest_enabled:
+        return None
+    if settings.duckdb_read_only:
+        raise DataAccessError(
+            "Review ingestion requires a writable database (TP_API_DUCKDB_READ_ONLY=false).",
+            status_code=503,
+        )
+
+    cache_key = (
+        settings.duckdb_path,
+        settings.ingest_batch_size,
+        settings.ingest_flush_interval,
+        settings.ingest_max_buffered_rows,
+    )
+    with _INGESTOR_LOCK:
+        ingestor = _INGESTOR_CACHE.get(cache_key)
+        if ingestor is None:
+            try:
+                ingestor = ReviewIngestor(
+                    database_path=settings.duckdb_path,
+                    batch_size=settings.ingest_batch_size,
+                    flush_interval=settings.ingest_flush_interval,
+                    max_buffered_rows=settings.ingest_max_buffered_rows,
+                )
+            except duckdb.Error as exc:
+                raise DataAccessError(
+                    "Failed to open the ingestion writer connection.",
+                    context={"database_path": settings.duckdb_path},
+                    status_code=503,
+                ) from exc
+            _INGESTOR_CACHE[cache_key] = ingestor
+    return ingestor
+
+
+def close_ingestors(timeout: float | None = None) -> None:
+    """Flush and close every ingestor; called on application shutdown."""
+    with _INGESTOR_LOCK:
+        ingestors = list(_INGESTOR_CACHE.values())
+        _INGESTOR_CACHE.clear()
+    for ingestor in ingestors:
+        ingestor.close(timeout)
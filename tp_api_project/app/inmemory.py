@@ -0,0 +1,139 @@
+"""Columnar in-memory serving backend for the review endpoints."""
+
+import sys
+import threading
+import time
+from typing import Any, Dict, List, Tuple
+
+import pyarrow as pa
+import pyarrow.compute as pc
+
+from .config import get_settings
+from .db import get_connection, qualify_table
+from .logging_config import get_logger
+
+Row = Tuple[Any, ...]
+QueryResult = Tuple[List[Row], List[str]]
+
+logger = get_logger(__name__)
+
+_USER_INFO_COLUMNS = ("reviewer_id", "reviewer_name", "email_address", "reviewer_country")
+
+
+def _row_ranges(keys: pa.Array) -> Dict[str, Tuple[int, int]]:
+    """Map each value of an already-sorted key column to its ``[start, end)`` row range."""
+    if len(keys) == 0:
+        return {}
+    encoded = pc.run_end_encode(keys)
+    ends = encoded.run_ends.to_pylist()
+    starts = [0, *ends[:-1]]
+    return dict(zip(encoded.values.to_pylist(), zip(starts, ends)))
+
+
+def _dict_bytes(ranges: Dict[str, Tuple[int, int]]) -> int:
+    """Approximate the Python heap used by an id-to-range index."""
+    return sys.getsizeof(ranges) + sum(
+        sys.getsizeof(key) + sys.getsizeof(value) for key, value in ranges.items()
+    )
+
+
+def _rows(table: pa.Table) -> List[Row]:
+    return list(zip(*(column.to_pylist() for column in table.columns)))
+
+
+class InMemoryReviewStore:
+    """Serve review lookups from Arrow columns without running SQL.
+
+    Rows are held once, sorted by ``(business_id, review_date desc)``, with an offset
+    range per business. Reviewer lookups go through a permutation array sorted by
+    ``(reviewer_id, review_date desc)`` and their own offset ranges, so both access
+    paths are a hash lookup plus a contiguous slice.
+    """
+
+    def __init__(self, table: pa.Table) -> None:
+        self._table = table.sort_by(
+            [("business_id", "ascending"), ("review_date", "descending")]
+        ).combine_chunks()
+        self._header = list(self._table.column_names)
+        self._business_ranges = _row_ranges(self._table.column("business_id").combine_chunks())
+
+        reviewer_order = pc.sort_indices(
+            self._table, sort_keys=[("reviewer_id", "ascending"), ("review_date", "descending")]
+        )
+        self._reviewer_order = reviewer_order.cast(pa.int32())
+        self._reviewer_ranges = _row_ranges(
+            self._table.column("reviewer_id").take(reviewer_order).combine_chunks()
+        )
+
+    @classmethod
+    def load(cls, table_name: str = "crt_tp_reviews") -> "InMemoryReviewStore":
+        """Read the live rows of the certified table through the DuckDB pool and index them."""
+        started = time.perf_counter()
+        with get_connection() as connection:
+            table_ref = qualify_table(connection, table_name)
+            # ``arrow()`` returns a Table on DuckDB 1.4 and a batch reader on later releases.
+            table = pa.table(
+                connection.execute(
+                    "select * exclude (row_hash, loaded_at, updated_at, is_deleted) "
+                    f"from {table_ref} where not is_deleted"
+                ).arrow()
+            )
+        store = cls(table)
+        logger.info(
+            "Loaded in-memory review store",
+            extra={
+                "context": {
+                    "rows": table.num_rows,
+                    "duration_ms": round((time.perf_counter() - started) * 1000, 2),
+                    **store.memory_footprint(),
+                }
+            },
+        )
+        return store
+
+    @property
+    def num_rows(self) -> int:
+        return self._table.num_rows
+
+    def reviews_by_business(self, business_id: str, limit: int, offset: int) -> QueryResult:
+        start, end = self._business_ranges.get(business_id, (0, 0))
+        start = min(start + offset, end)
+        rows = self._table.slice(start, min(limit, end - start))
+        return _rows(rows), list(self._header)
+
+    def reviews_by_user(self, user_id: str, limit: int, offset: int) -> QueryResult:
+        start, end = self._reviewer_ranges.get(user_id, (0, 0))
+        start = min(start + offset, end)
+        positions = self._reviewer_order.slice(start, min(limit, end - start))
+        return _rows(self._table.take(positions)), list(self._header)
+
+    def user_info(self, user_id: str) -> QueryResult:
+        start, end = self._reviewer_ranges.get(user_id, (0, 0))
+        positions = self._reviewer_order.slice(start, end - start)
+        rows = self._table.select(list(_USER_INFO_COLUMNS)).take(positions)
+        return list(dict.fromkeys(_rows(rows))), list(_USER_INFO_COLUMNS)
+
+    def memory_footprint(self) -> Dict[str, int]:
+        """Report the bytes held by the column data and each index."""
+        return {
+            "columns_bytes": self._table.nbytes,
+            "reviewer_order_bytes": self._reviewer_order.nbytes,
+            "business_index_bytes": _dict_bytes(self._business_ranges),
+            "reviewer_index_bytes": _dict_bytes(self._reviewer_ranges),
+        }
+
+
+_STORE_CACHE: Dict[tuple, InMemoryReviewStore] = {}
+_STORE_LOCK = threading.Lock()
+
+
+def get_review_store() -> InMemoryReviewStore:
+    """Return the process-wide in-memory store, loading it on first use."""
+    settings = get_settings()
+    cache_key = (settings.duckdb_path, settings.duckdb_schema)
+    with _STORE_LOCK:
+        store = _STORE_CACHE.get(cache_key)
+        if store is None:
+            store = InMemoryReviewStore.load()
+            _STORE_CACHE[cache_key] = store
+    return store
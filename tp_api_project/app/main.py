@@ -1,25 +1,56 @@
 """HTTP routes and exception handlers for the Trustpilot take-home API."""
 
-from typing import Annotated, Any
+import asyncio
+import hmac
+from contextlib import asynccontextmanager
+from datetime import datetime
+from typing import Annotated, Any, AsyncIterator
 
-from fastapi import Depends, FastAPI, Query, Request, status
-from fastapi.responses import JSONResponse, StreamingResponse
+from fastapi import Body, Depends, FastAPI, Header, HTTPException, Query, Request, status
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import JSONResponse, PlainTextResponse, StreamingResponse
+from pydantic import Field, ValidationError
 
-from . import queries
+from . import queries, warmup
+from .admission import AdmissionMiddleware, get_admission_controller
+from .config import get_settings
 from .exceptions import DataAccessError, RecordNotFoundError
+from .ingest import close_ingestors, get_ingestor
 from .logging_config import get_logger
 from .schemas import (
     BusinessReviewsQuery,
+    BusinessSearchQuery,
     ErrorResponse,
     HealthResponse,
+    IngestReceipt,
+    ReviewChangesQuery,
+    ReviewIn,
+    SlowQueryEntry,
     UserReviewsQuery,
 )
+from .slow_query_log import get_slow_query_log
 from .utils import stream_csv
 
-app = FastAPI(title="Trustpilot Take-Home API")
+
+@asynccontextmanager
+async def lifespan(_: FastAPI) -> AsyncIterator[None]:
+    """Warm the database in the background; `/readyz` passes once it has finished.
+
+    On shutdown any buffered reviews are flushed before the writer connection closes.
+    """
+    warmup_task = asyncio.create_task(asyncio.to_thread(warmup.run_warmup))
+    try:
+        yield
+    finally:
+        await warmup_task
+        await asyncio.to_thread(close_ingestors)
+
+
+app = FastAPI(title="Trustpilot Take-Home API", lifespan=lifespan)
+app.add_middleware(AdmissionMiddleware)
 logger = get_logger(__name__)
 
-CSV_STREAMING_RESPONSES = {
+CSV_STREAMING_RESPONSES: dict[int | str, dict[str, Any]] = {
     200: {
         "description": "CSV stream",
         "content": {
@@ -40,9 +71,13 @@ CSV_STREAMING_RESPONSES = {
         "model": ErrorResponse,
         "description": "Database access error",
     },
+    429: {
+        "model": ErrorResponse,
+        "description": "Client rate or concurrency limit exceeded",
+    },
     503: {
         "model": ErrorResponse,
-        "description": "Database unavailable",
+        "description": "Database unavailable or request shed under load",
     },
 }
 
@@ -67,6 +102,44 @@ def _user_query_params(
     return UserReviewsQuery.model_validate({"user_id": user_id, "limit": limit, "offset": offset})
 
 
+def _business_search_params(
+    prefix: Annotated[str, Query(min_length=1, max_length=100)],
+    limit: Annotated[int, Query(ge=1, le=50)] = 10,
+) -> BusinessSearchQuery:
+    """Normalise business search parameters before consulting the index."""
+    return BusinessSearchQuery.model_validate({"prefix": prefix, "limit": limit})
+
+
+def _changes_query_params(
+    since: Annotated[datetime | None, Query()] = None,
+    after_id: Annotated[str | None, Query(min_length=1)] = None,
+    limit: Annotated[int, Query(ge=1, le=10000)] = 1000,
+) -> ReviewChangesQuery:
+    """Validate change-feed keyset parameters before hitting the database."""
+    try:
+        return ReviewChangesQuery.model_validate(
+            {"since": since, "after_id": after_id, "limit": limit}
+        )
+    except ValidationError as exc:
+        raise RequestValidationError(exc.errors(include_url=False)) from exc
+
+
+def _require_debug_token(
+    authorization: Annotated[str | None, Header()] = None,
+) -> None:
+    """Guard debug endpoints behind the `TP_API_DEBUG_TOKEN` bearer token."""
+    token = get_settings().debug_token
+    if token is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not Found")
+    scheme, _, supplied = (authorization or "").partition(" ")
+    if scheme.lower() != "bearer" or not hmac.compare_digest(supplied.encode(), token.encode()):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="A valid debug token is required.",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+
 def _error_payload(message: str, context: dict[str, Any] | None = None) -> dict[str, Any]:
     """Build the JSON error payload returned by the exception handlers."""
     return ErrorResponse(detail=message, context=context).model_dump(exclude_none=True)
@@ -122,6 +195,25 @@ def reviews_by_user(
     return StreamingResponse(stream_csv(rows, header), media_type="text/csv")
 
 
+@app.get(
+    "/reviews/changes",
+    response_class=StreamingResponse,
+    responses={code: spec for code, spec in CSV_STREAMING_RESPONSES.items() if code != 404},
+)
+def review_changes(
+    params: Annotated[ReviewChangesQuery, Depends(_changes_query_params)],
+) -> StreamingResponse:
+    """Stream reviews inserted, updated or tombstoned after a watermark as CSV.
+
+    Rows are ordered by ``(updated_at, review_id)``. Pass the last row's ``updated_at``
+    and ``review_id`` back as ``since`` and ``after_id`` to fetch the next page; a page
+    with only the header row means the mirror is up to date. Tombstones have
+    ``is_deleted`` set.
+    """
+    rows, header = queries.get_review_changes(params.since, params.after_id, params.limit)
+    return StreamingResponse(stream_csv(rows, header), media_type="text/csv")
+
+
 @app.get(
     "/users/{user_id}",
     response_class=StreamingResponse,
@@ -133,7 +225,107 @@ def user_info(user_id: str) -> StreamingResponse:
     return StreamingResponse(stream_csv(rows, header), media_type="text/csv")
 
 
+@app.post(
+    "/reviews",
+    response_model=IngestReceipt,
+    status_code=status.HTTP_202_ACCEPTED,
+    responses={
+        201: {"model": IngestReceipt, "description": "Reviews committed to the landing table"},
+        404: {"model": ErrorResponse, "description": "Review ingestion is disabled"},
+        500: {"model": ErrorResponse, "description": "The batch could not be committed"},
+        503: {"model": ErrorResponse, "description": "Ingestion buffer full or database read-only"},
+        504: {"model": ErrorResponse, "description": "Commit did not finish in time"},
+    },
+)
+async def ingest_reviews(
+    reviews: Annotated[
+        ReviewIn | Annotated[list[ReviewIn], Field(min_length=1, max_length=1000)], Body()
+    ],
+    wait: Annotated[
+        bool,
+        Query(description="Respond only once the reviews are committed to the landing table"),
+    ] = False,
+) -> JSONResponse:
+    """Accept one review or an array of reviews for micro-batched ingestion.
+
+    Without ``wait`` the reviews are acknowledged with 202 once buffered and are lost if
+    the process dies before the next flush. With ``wait=true`` the response is 201 after
+    the batch holding them has been committed.
+    """
+    ingestor = await asyncio.to_thread(get_ingestor)
+    if ingestor is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Review ingestion is disabled."
+        )
+    batch = reviews if isinstance(reviews, list) else [reviews]
+    committed = ingestor.submit(batch)
+    if not wait:
+        receipt = IngestReceipt(accepted=len(batch), status="buffered", batch_id=None)
+        return JSONResponse(status_code=status.HTTP_202_ACCEPTED, content=receipt.model_dump())
+
+    timeout = get_settings().ingest_wait_timeout
+    try:
+        batch_id = await asyncio.wait_for(asyncio.wrap_future(committed), timeout)
+    except TimeoutError as exc:
+        raise DataAccessError(
+            "Timed out waiting for the reviews to be committed; they remain buffered.",
+            context={"timeout": timeout},
+            status_code=status.HTTP_504_GATEWAY_TIMEOUT,
+        ) from exc
+    receipt = IngestReceipt(accepted=len(batch), status="committed", batch_id=batch_id)
+    return JSONResponse(status_code=status.HTTP_201_CREATED, content=receipt.model_dump())
+
+
+@app.get(
+    "/businesses",
+    response_class=StreamingResponse,
+    responses=CSV_STREAMING_RESPONSES,
+)
+def businesses(
+    params: Annotated[BusinessSearchQuery, Depends(_business_search_params)],
+) -> StreamingResponse:
+    """Stream businesses whose name starts with ``prefix`` as CSV, most reviewed first.
+
+    Matching ignores case, accents and punctuation.
+    """
+    rows, header = queries.search_businesses(params.prefix, params.limit)
+    return StreamingResponse(stream_csv(rows, header), media_type="text/csv")
+
+
 @app.get("/healthz", response_model=HealthResponse)
 def healthcheck() -> HealthResponse:
     """Basic liveness check consumed by uptime monitors."""
     return HealthResponse(status="ok")
+
+
+@app.get(
+    "/readyz",
+    response_model=HealthResponse,
+    responses={503: {"model": HealthResponse, "description": "Not ready to serve traffic"}},
+)
+def readiness() -> JSONResponse:
+    """Readiness check that passes once warm-up has completed and the database is reachable."""
+    if warmup.is_ready():
+        return JSONResponse(content=HealthResponse(status="ok").model_dump())
+    return JSONResponse(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        content=HealthResponse(status="fail").model_dump(),
+    )
+
+
+@app.get("/metrics", response_class=PlainTextResponse)
+def metrics() -> PlainTextResponse:
+    """Expose admission control gauges and counters in the Prometheus text format."""
+    controller = get_admission_controller()
+    body = controller.render_metrics() if controller is not None else ""
+    return PlainTextResponse(body, media_type="text/plain; version=0.0.4")
+
+
+@app.get(
+    "/debug/slow-queries",
+    response_model=list[SlowQueryEntry],
+    dependencies=[Depends(_require_debug_token)],
+)
+def slow_queries() -> list[SlowQueryEntry]:
+    """Return the most recent slow or sampled queries, newest first."""
+    return get_slow_query_log().entries()
@@ -1,25 +1,33 @@
 """Database access helpers that back the FastAPI review endpoints."""
 
 from contextlib import ExitStack
-from typing import Any, Iterable, Iterator, List, Tuple
+from datetime import datetime
+from typing import Any, Callable, Hashable, Iterable, Iterator, List, Optional, Tuple
 
 import duckdb
 
+from .business_index import get_business_index
+from .coalescing import get_single_flight
+from .config import get_settings
 from .db import get_connection, qualify_table
 from .exceptions import DataAccessError, RecordNotFoundError
+from .inmemory import get_review_store
 from .logging_config import get_logger
+from .slow_query_log import get_slow_query_log
 
 Row = Tuple[Any, ...]
 QueryResult = Tuple[Iterable[Row], List[str]]
 
 _STREAM_BATCH_SIZE = 1024
 
+# Live reviews only, without the dbt bookkeeping columns, so the CSV shape of the
+# lookup endpoints is unchanged by the change-feed watermark.
+_LIVE_REVIEW_COLUMNS = "* exclude (row_hash, loaded_at, updated_at, is_deleted)"
+
 logger = get_logger(__name__)
 
 
-def _row_iterator(
-    result: duckdb.DuckDBPyRelation, stack: ExitStack, first_batch: list[Row]
-) -> Iterator[Row]:
+def _row_iterator(result: Any, stack: ExitStack, first_batch: list[Row]) -> Iterator[Row]:
     """Yield rows from a DuckDB cursor while keeping the connection alive."""
 
     def iterator() -> Iterator[Row]:
@@ -35,22 +43,111 @@ def _row_iterator(
     return iterator()
 
 
+def _coalesced(key: Hashable, fn: Callable[[], QueryResult]) -> QueryResult:
+    """Run ``fn`` through the single-flight coalescer when it is enabled."""
+    single_flight = get_single_flight(_STREAM_BATCH_SIZE)
+    if single_flight is None:
+        return fn()
+    return single_flight.do(key, fn)
+
+
+def _from_store(result: QueryResult, context: dict[str, Any], message: str) -> QueryResult:
+    """Raise the same not-found error as the SQL path when the store has no rows."""
+    rows, header = result
+    if not rows:
+        logger.info(message, extra={"context": context})
+        raise RecordNotFoundError(message, context=context)
+    return rows, header
+
+
+def _use_store() -> bool:
+    return get_settings().database_backend == "inmemory"
+
+
 def get_reviews_by_business(business_id: str, limit: int = 100, offset: int = 0) -> QueryResult:
+    """Fetch reviews for a business, sharing one execution across identical requests."""
+    if _use_store():
+        return _from_store(
+            get_review_store().reviews_by_business(business_id, limit, offset),
+            context={"business_id": business_id},
+            message="No reviews were found for the requested business.",
+        )
+    return _coalesced(
+        ("reviews_by_business", business_id, limit, offset),
+        lambda: _query_reviews_by_business(business_id, limit, offset),
+    )
+
+
+def get_reviews_by_user(user_id: str, limit: int = 100, offset: int = 0) -> QueryResult:
+    """Fetch reviews by a user, sharing one execution across identical requests."""
+    if _use_store():
+        return _from_store(
+            get_review_store().reviews_by_user(user_id, limit, offset),
+            context={"user_id": user_id},
+            message="No reviews were found for the requested user.",
+        )
+    return _coalesced(
+        ("reviews_by_user", user_id, limit, offset),
+        lambda: _query_reviews_by_user(user_id, limit, offset),
+    )
+
+
+def get_user_info(user_id: str) -> QueryResult:
+    """Fetch reviewer metadata, sharing one execution across identical requests."""
+    if _use_store():
+        return _from_store(
+            get_review_store().user_info(user_id),
+            context={"user_id": user_id},
+            message="No user information was found for the requested user.",
+        )
+    return _coalesced(("user_info", user_id), lambda: _query_user_info(user_id))
+
+
+def search_businesses(prefix: str, limit: int = 10) -> QueryResult:
+    """Find businesses by name prefix in the in-process index, most reviewed first."""
+    context = {"prefix": prefix}
+    try:
+        index = get_business_index()
+    except duckdb.Error as exc:
+        logger.exception("Failed to load the business index", extra={"context": context})
+        raise DataAccessError("Unable to search businesses.", context=context) from exc
+    return _from_store(
+        index.search(prefix, limit),
+        context=context,
+        message="No businesses match the requested prefix.",
+    )
+
+
+def get_review_changes(
+    since: Optional[datetime] = None, after_id: Optional[str] = None, limit: int = 1000
+) -> QueryResult:
+    """Fetch rows changed after a watermark, sharing one execution across identical polls.
+
+    Always served from DuckDB, because the in-memory store holds no tombstones.
+    """
+    return _coalesced(
+        ("review_changes", since, after_id, limit),
+        lambda: _query_review_changes(since, after_id, limit),
+    )
+
+
+def _query_reviews_by_business(business_id: str, limit: int = 100, offset: int = 0) -> QueryResult:
     """Fetch reviews for a business ordered by most recent first."""
     params = [business_id, limit, offset]
     stack = ExitStack()
     con = stack.enter_context(get_connection())
     table_ref = qualify_table(con, "crt_tp_reviews")
     sql = f"""
-    select *
+    select {_LIVE_REVIEW_COLUMNS}
     from {table_ref}
-    where business_id = ?
+    where business_id = ? and not is_deleted
     order by review_date desc
     limit ? offset ?
     """
     try:
-        result = con.execute(sql, params)
-        header = [d[0] for d in result.description]
+        result, header, first_batch = get_slow_query_log().execute(
+            con, "reviews_by_business", sql, params, _STREAM_BATCH_SIZE
+        )
     except duckdb.Error as exc:
         stack.close()
         logger.exception(
@@ -61,7 +158,6 @@ def get_reviews_by_business(business_id: str, limit: int = 100, offset: int = 0)
             "Unable to retrieve reviews for the requested business.",
             context={"business_id": business_id},
         ) from exc
-    first_batch = result.fetchmany(_STREAM_BATCH_SIZE)
     if not first_batch:
         stack.close()
         context = {"business_id": business_id}
@@ -74,22 +170,23 @@ def get_reviews_by_business(business_id: str, limit: int = 100, offset: int = 0)
     return rows, header
 
 
-def get_reviews_by_user(user_id: str, limit: int = 100, offset: int = 0) -> QueryResult:
+def _query_reviews_by_user(user_id: str, limit: int = 100, offset: int = 0) -> QueryResult:
     """Fetch reviews authored by a single user ordered by most recent first."""
     params = [user_id, limit, offset]
     stack = ExitStack()
     con = stack.enter_context(get_connection())
     table_ref = qualify_table(con, "crt_tp_reviews")
     sql = f"""
-    select *
+    select {_LIVE_REVIEW_COLUMNS}
     from {table_ref}
-    where reviewer_id = ?
+    where reviewer_id = ? and not is_deleted
     order by review_date desc
     limit ? offset ?
     """
     try:
-        result = con.execute(sql, params)
-        header = [d[0] for d in result.description]
+        result, header, first_batch = get_slow_query_log().execute(
+            con, "reviews_by_user", sql, params, _STREAM_BATCH_SIZE
+        )
     except duckdb.Error as exc:
         stack.close()
         logger.exception(
@@ -100,7 +197,6 @@ def get_reviews_by_user(user_id: str, limit: int = 100, offset: int = 0) -> Quer
             "Unable to retrieve reviews for the requested user.",
             context={"user_id": user_id},
         ) from exc
-    first_batch = result.fetchmany(_STREAM_BATCH_SIZE)
     if not first_batch:
         stack.close()
         context = {"user_id": user_id}
@@ -113,7 +209,7 @@ def get_reviews_by_user(user_id: str, limit: int = 100, offset: int = 0) -> Quer
     return rows, header
 
 
-def get_user_info(user_id: str) -> QueryResult:
+def _query_user_info(user_id: str) -> QueryResult:
     """Fetch distinct reviewer metadata for the requested user."""
     params = [user_id]
     stack = ExitStack()
@@ -122,11 +218,12 @@ def get_user_info(user_id: str) -> QueryResult:
     sql = f"""
     select distinct reviewer_id, reviewer_name, email_address, reviewer_country
     from {table_ref}
-    where reviewer_id = ?
+    where reviewer_id = ? and not is_deleted
     """
     try:
-        result = con.execute(sql, params)
-        header = [d[0] for d in result.description]
+        result, header, first_batch = get_slow_query_log().execute(
+            con, "user_info", sql, params, _STREAM_BATCH_SIZE
+        )
     except duckdb.Error as exc:
         stack.close()
         logger.exception(
@@ -137,7 +234,6 @@ def get_user_info(user_id: str) -> QueryResult:
             "Unable to retrieve user information.",
             context={"user_id": user_id},
         ) from exc
-    first_batch = result.fetchmany(_STREAM_BATCH_SIZE)
     if not first_batch:
         stack.close()
         context = {"user_id": user_id}
@@ -148,3 +244,42 @@ def get_user_info(user_id: str) -> QueryResult:
         )
     rows = _row_iterator(result, stack, first_batch)
     return rows, header
+
+
+def _query_review_changes(
+    since: Optional[datetime] = None, after_id: Optional[str] = None, limit: int = 1000
+) -> QueryResult:
+    """Fetch inserted, updated and tombstoned rows in ``(updated_at, review_id)`` order.
+
+    The page starts strictly after the ``(since, after_id)`` keyset position, so a
+    client resumes from the last row it received. An empty page means it is caught up.
+    """
+    stack = ExitStack()
+    con = stack.enter_context(get_connection())
+    table_ref = qualify_table(con, "crt_tp_reviews")
+    params: List[Any]
+    if since is None:
+        where, params = "", [limit]
+    elif after_id is None:
+        where, params = "where updated_at > ?", [since, limit]
+    else:
+        where = "where updated_at > ? or (updated_at = ? and review_id > ?)"
+        params = [since, since, after_id, limit]
+    sql = f"""
+    select * exclude (row_hash)
+    from {table_ref}
+    {where}
+    order by updated_at, review_id
+    limit ?
+    """
+    context = {"since": since.isoformat() if since else None, "after_id": after_id}
+    try:
+        result, header, first_batch = get_slow_query_log().execute(
+            con, "review_changes", sql, params, _STREAM_BATCH_SIZE
+        )
+    except duckdb.Error as exc:
+        stack.close()
+        logger.exception("Failed to fetch review changes", extra={"context": context})
+        raise DataAccessError("Unable to retrieve review changes.", context=context) from exc
+    rows = _row_iterator(result, stack, first_batch)
+    return rows, header
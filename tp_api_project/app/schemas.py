@@ -1,6 +1,7 @@
+from datetime import date, datetime, timezone
 from typing import Any, Dict
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
 
 
 class BusinessReviewsQuery(BaseModel):
@@ -19,6 +20,37 @@ class UserReviewsQuery(BaseModel):
     model_config = ConfigDict(extra="forbid")
 
 
+class BusinessSearchQuery(BaseModel):
+    prefix: str = Field(..., min_length=1, max_length=100, description="Start of the business name")
+    limit: int = Field(10, ge=1, le=50, description="Maximum number of businesses to return")
+
+    model_config = ConfigDict(extra="forbid")
+
+
+class ReviewChangesQuery(BaseModel):
+    since: datetime | None = Field(None, description="Return rows updated after this watermark")
+    after_id: str | None = Field(
+        None, min_length=1, description="review_id of the last row already received at `since`"
+    )
+    limit: int = Field(1000, ge=1, le=10000)
+
+    model_config = ConfigDict(extra="forbid")
+
+    @field_validator("since")
+    @classmethod
+    def _to_naive_utc(cls, value: datetime | None) -> datetime | None:
+        """Watermarks are stored as naive UTC, so normalise aware timestamps to match."""
+        if value is not None and value.tzinfo is not None:
+            return value.astimezone(timezone.utc).replace(tzinfo=None)
+        return value
+
+    @model_validator(mode="after")
+    def _after_id_needs_since(self) -> "ReviewChangesQuery":
+        if self.after_id is not None and self.since is None:
+            raise ValueError("after_id can only be used together with since")
+        return self
+
+
 class ErrorResponse(BaseModel):
     detail: str
     context: Dict[str, Any] | None = None
@@ -30,3 +62,44 @@ class HealthResponse(BaseModel):
     status: str = Field(..., pattern="^(ok|fail)$", description="Service status indicator")
 
     model_config = ConfigDict(extra="forbid")
+
+
+class SlowQueryEntry(BaseModel):
+    recorded_at: datetime
+    query_name: str
+    fingerprint: str = Field(..., description="Hash of the whitespace-normalised SQL text")
+    params_hash: str = Field(..., description="Hash of the bound parameters")
+    duration_ms: float
+    rows_returned: int
+    rows_scanned: int | None = None
+    reason: str = Field(..., pattern="^(threshold|sampled)$")
+    plan: Dict[str, Any] | None = Field(None, description="DuckDB operator tree when profiled")
+
+    model_config = ConfigDict(extra="forbid")
+
+
+class ReviewIn(BaseModel):
+    """A new review, validated against the ``crt_tp_reviews`` column contract."""
+
+    review_id: str = Field(..., min_length=1, max_length=64)
+    reviewer_id: str = Field(..., min_length=1, max_length=64)
+    business_id: str = Field(..., min_length=1, max_length=64)
+    reviewer_name: str | None = Field(None, max_length=200)
+    business_name: str | None = Field(None, max_length=200)
+    review_title: str | None = Field(None, max_length=200)
+    review_content: str | None = Field(None, max_length=10000)
+    review_rating: int = Field(..., ge=1, le=5)
+    review_ip_address: str | None = Field(None, max_length=45)
+    email_address: str | None = Field(None, max_length=254, pattern=r"^[^@\s]+@[^@\s]+$")
+    reviewer_country: str | None = Field(None, max_length=100)
+    review_date: date
+
+    model_config = ConfigDict(extra="forbid", str_strip_whitespace=True)
+
+
+class IngestReceipt(BaseModel):
+    accepted: int = Field(..., description="Number of reviews accepted from the request")
+    status: str = Field(..., pattern="^(buffered|committed)$")
+    batch_id: str | None = Field(None, description="Landing batch the reviews were committed in")
+
+    model_config = ConfigDict(extra="forbid")
@@ -0,0 +1,265 @@
+"""Threshold-based slow-query log with DuckDB profiling capture."""
+
+import hashlib
+import json
+import os
+import random
+import re
+import tempfile
+import threading
+import time
+from collections import deque
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Any, Deque, Dict, List, Optional, Sequence, Tuple
+
+from duckdb import DuckDBPyConnection
+
+from .config import get_settings
+from .logging_config import get_logger
+from .schemas import SlowQueryEntry
+
+Row = Tuple[Any, ...]
+
+logger = get_logger(__name__)
+
+_WHITESPACE = re.compile(r"\s+")
+_PLAN_KEYS = (
+    "operator_type",
+    "operator_timing",
+    "operator_cardinality",
+    "operator_rows_scanned",
+    "extra_info",
+)
+
+
+@lru_cache(maxsize=256)
+def fingerprint(sql: str) -> str:
+    """Return a stable short hash of the whitespace-normalised SQL text."""
+    normalized = _WHITESPACE.sub(" ", sql).strip().lower()
+    return hashlib.sha1(normalized.encode("utf-8")).hexdigest()[:16]
+
+
+def _params_hash(params: Sequence[Any]) -> str:
+    """Hash bound parameters so entries can be correlated without storing identifiers."""
+    return hashlib.sha256(repr(list(params)).encode("utf-8")).hexdigest()[:16]
+
+
+def _redact(value: Any, secrets: Sequence[str]) -> Any:
+    """Mask bound parameter values that DuckDB inlines into filter descriptions."""
+    if isinstance(value, str):
+        for secret in secrets:
+            value = value.replace(secret, "?")
+        return value
+    if isinstance(value, list):
+        return [_redact(item, secrets) for item in value]
+    if isinstance(value, dict):
+        return {key: _redact(item, secrets) for key, item in value.items()}
+    return value
+
+
+def _compact_plan(node: Dict[str, Any], secrets: Sequence[str]) -> Dict[str, Any]:
+    """Keep the operator fields worth reading from DuckDB's JSON profile."""
+    compact = {key: _redact(node[key], secrets) for key in _PLAN_KEYS if key in node}
+    compact["children"] = [_compact_plan(child, secrets) for child in node.get("children", [])]
+    return compact
+
+
+def _read_profile(path: str) -> Optional[Dict[str, Any]]:
+    try:
+        with open(path, encoding="utf-8") as handle:
+            profile: Dict[str, Any] = json.load(handle)
+    except (OSError, ValueError):
+        logger.warning("Could not read DuckDB profiling output", exc_info=True)
+        return None
+    return profile
+
+
+class _BufferedResult:
+    """Serve the remaining rows of a profiled query that had to be fetched eagerly."""
+
+    def __init__(self, rows: List[Row]) -> None:
+        self._rows = rows
+        self._position = 0
+
+    def fetchmany(self, size: int) -> List[Row]:
+        batch = self._rows[self._position : self._position + size]
+        self._position += len(batch)
+        return batch
+
+
+class SlowQueryLog:
+    """Record slow and sampled queries in a bounded in-memory ring buffer.
+
+    Unsampled queries only pay for two clock reads. A query over the threshold is logged
+    without a plan and its fingerprint and parameters are flagged, so the next execution
+    of the same statement with the same parameters runs with DuckDB's JSON profiler and
+    is recorded with its operator tree, however long it takes.
+    """
+
+    def __init__(self, threshold_ms: float, sample_rate: float, max_entries: int) -> None:
+        self._threshold_ms = threshold_ms
+        self._sample_rate = sample_rate
+        self._entries: Deque[SlowQueryEntry] = deque(maxlen=max_entries)
+        self._lock = threading.Lock()
+        # Insertion-ordered so the oldest flags are dropped once ``max_entries`` are pending.
+        self._pending_profiles: Dict[Tuple[str, str], None] = {}
+        self._max_pending = max_entries
+
+    def entries(self) -> List[SlowQueryEntry]:
+        """Return recorded entries, newest first."""
+        with self._lock:
+            return list(reversed(self._entries))
+
+    def execute(
+        self,
+        connection: DuckDBPyConnection,
+        query_name: str,
+        sql: str,
+        params: Sequence[Any],
+        batch_size: int,
+    ) -> Tuple[Any, List[str], List[Row]]:
+        """Run ``sql`` and fetch its first batch, returning ``(result, header, batch)``.
+
+        ``result`` exposes ``fetchmany`` for the remaining rows.
+        """
+        query_fingerprint = fingerprint(sql)
+        sampled = bool(self._sample_rate) and random.random() < self._sample_rate
+        flagged = False
+        if self._pending_profiles:
+            pending_key = (query_fingerprint, _params_hash(params))
+            with self._lock:
+                flagged = pending_key in self._pending_profiles
+                self._pending_profiles.pop(pending_key, None)
+        if sampled or flagged:
+            return self._execute_profiled(
+                connection, query_name, sql, params, batch_size, query_fingerprint, sampled, flagged
+            )
+
+        started = time.perf_counter()
+        result = connection.execute(sql, params)
+        header = [d[0] for d in result.description]
+        first_batch = result.fetchmany(batch_size)
+        duration_ms = (time.perf_counter() - started) * 1000
+        if duration_ms >= self._threshold_ms:
+            with self._lock:
+                self._pending_profiles[(query_fingerprint, _params_hash(params))] = None
+                if len(self._pending_profiles) > self._max_pending:
+                    del self._pending_profiles[next(iter(self._pending_profiles))]
+            self._record(
+                query_name=query_name,
+                query_fingerprint=query_fingerprint,
+                params=params,
+                duration_ms=duration_ms,
+                rows_returned=len(first_batch),
+                reason="threshold",
+            )
+        return result, header, first_batch
+
+    def _execute_profiled(
+        self,
+        connection: DuckDBPyConnection,
+        query_name: str,
+        sql: str,
+        params: Sequence[Any],
+        batch_size: int,
+        query_fingerprint: str,
+        sampled: bool,
+        flagged: bool,
+    ) -> Tuple[Any, List[str], List[Row]]:
+        # Profiling settings are per connection, so run on a cursor to leave the pooled
+        # handle untouched. DuckDB only writes the profile once the result is drained.
+        fd, profile_path = tempfile.mkstemp(prefix="tp_api_profile_", suffix=".json")
+        os.close(fd)
+        cursor = connection.cursor()
+        try:
+            cursor.execute("PRAGMA enable_profiling='json'")
+            cursor.execute(f"PRAGMA profiling_output='{profile_path.replace("'", "''")}'")
+            started = time.perf_counter()
+            cursor.execute(sql, params)
+            header = [d[0] for d in cursor.description]
+            rows = cursor.fetchall()
+            duration_ms = (time.perf_counter() - started) * 1000
+            cursor.execute("PRAGMA disable_profiling")
+            profile = _read_profile(profile_path)
+        finally:
+            cursor.close()
+            try:
+                os.unlink(profile_path)
+            except OSError:
+                pass
+
+        slow = duration_ms >= self._threshold_ms
+        # A flagged run is the follow-up to an earlier threshold entry, so keep its profile
+        # even when this execution happened to be fast.
+        if sampled or flagged or slow:
+            self._record(
+                query_name=query_name,
+                query_fingerprint=query_fingerprint,
+                params=params,
+                duration_ms=duration_ms,
+                rows_returned=len(rows),
+                reason="threshold" if slow or flagged else "sampled",
+                profile=profile,
+            )
+        return _BufferedResult(rows[batch_size:]), header, rows[:batch_size]
+
+    def _record(
+        self,
+        query_name: str,
+        query_fingerprint: str,
+        params: Sequence[Any],
+        duration_ms: float,
+        rows_returned: int,
+        reason: str,
+        profile: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        secrets = [param for param in params if isinstance(param, str) and param]
+        entry = SlowQueryEntry(
+            recorded_at=datetime.now(timezone.utc),
+            query_name=query_name,
+            fingerprint=query_fingerprint,
+            params_hash=_params_hash(params),
+            duration_ms=round(duration_ms, 3),
+            rows_returned=rows_returned,
+            rows_scanned=profile.get("cumulative_rows_scanned") if profile else None,
+            reason=reason,
+            plan=_compact_plan(profile, secrets) if profile else None,
+        )
+        with self._lock:
+            self._entries.append(entry)
+        if reason == "threshold":
+            logger.warning(
+                "Slow query",
+                extra={
+                    "context": {
+                        "query_name": query_name,
+                        "fingerprint": query_fingerprint,
+                        "duration_ms": entry.duration_ms,
+                    }
+                },
+            )
+
+
+_SLOW_QUERY_LOG_CACHE: Dict[tuple, SlowQueryLog] = {}
+_SLOW_QUERY_LOG_LOCK = threading.Lock()
+
+
+def get_slow_query_log() -> SlowQueryLog:
+    """Return the process-wide slow-query log for the current settings."""
+    settings = get_settings()
+    cache_key = (
+        settings.slow_query_threshold_ms,
+        settings.slow_query_sample_rate,
+        settings.slow_query_log_size,
+    )
+    with _SLOW_QUERY_LOG_LOCK:
+        slow_query_log = _SLOW_QUERY_LOG_CACHE.get(cache_key)
+        if slow_query_log is None:
+            slow_query_log = SlowQueryLog(
+                threshold_ms=settings.slow_query_threshold_ms,
+                sample_rate=settings.slow_query_sample_rate,
+                max_entries=settings.slow_query_log_size,
+            )
+            _SLOW_QUERY_LOG_CACHE[cache_key] = slow_query_log
+    return slow_query_log
@@ -0,0 +1,118 @@
+"""Startup warm-up and readiness tracking for the DuckDB-backed API."""
+
+import threading
+import time
+from dataclasses import dataclass
+
+import duckdb
+
+from .business_index import get_business_index
+from .config import get_settings
+from .db import get_connection, get_pool, qualify_table
+from .exceptions import DataAccessError
+from .inmemory import get_review_store
+from .logging_config import get_logger
+
+logger = get_logger(__name__)
+
+_WARMUP_TABLES = ("crt_tp_reviews",)
+
+
+@dataclass(frozen=True, slots=True)
+class WarmupState:
+    """Outcome of the most recent warm-up run."""
+
+    completed: bool = False
+    error: str | None = None
+    duration_ms: float | None = None
+
+
+_STATE = WarmupState()
+_STATE_LOCK = threading.Lock()
+
+
+def get_state() -> WarmupState:
+    with _STATE_LOCK:
+        return _STATE
+
+
+def _set_state(state: WarmupState) -> None:
+    global _STATE
+    with _STATE_LOCK:
+        _STATE = state
+
+
+def run_warmup() -> WarmupState:
+    """Open the pool's minimum connections, resolve table schemas and run warm-up queries.
+
+    Warm-up queries may reference tables as ``{crt_tp_reviews}`` placeholders, which are
+    substituted with the schema-qualified name. With the in-memory backend the review store
+    is loaded too. Failures are logged and leave the service unready rather than aborting
+    startup. The business name index is also loaded, but only ``/businesses`` depends on
+    it, so a failure there is logged and the index is retried on first use.
+    """
+    settings = get_settings()
+    _set_state(WarmupState())
+    if not settings.warmup_enabled:
+        state = WarmupState(completed=True, duration_ms=0.0)
+        _set_state(state)
+        return state
+
+    started = time.perf_counter()
+    try:
+        opened = get_pool().prefill(settings.connection_pool_min_size)
+        with get_connection() as connection:
+            tables = {name: qualify_table(connection, name) for name in _WARMUP_TABLES}
+            for query in settings.warmup_queries:
+                connection.execute(query.format(**tables)).fetchall()
+        _load_business_index()
+        if settings.database_backend == "inmemory":
+            get_review_store()
+    except Exception as exc:
+        duration_ms = (time.perf_counter() - started) * 1000
+        logger.exception(
+            "Warm-up failed",
+            extra={"context": {"duration_ms": round(duration_ms, 2)}},
+        )
+        state = WarmupState(completed=False, error=str(exc), duration_ms=duration_ms)
+    else:
+        duration_ms = (time.perf_counter() - started) * 1000
+        logger.info(
+            "Warm-up completed",
+            extra={
+                "context": {
+                    "connections_opened": opened,
+                    "queries": len(settings.warmup_queries),
+                    "duration_ms": round(duration_ms, 2),
+                }
+            },
+        )
+        state = WarmupState(completed=True, duration_ms=duration_ms)
+    _set_state(state)
+    return state
+
+
+def _load_business_index() -> None:
+    try:
+        get_business_index()
+    except (duckdb.Error, DataAccessError):
+        logger.warning(
+            "Could not load the business index; /businesses will retry on first use",
+            exc_info=True,
+        )
+
+
+def is_ready() -> bool:
+    """Return whether warm-up has completed and the database answers a trivial query.
+
+    The query runs on the pool's dedicated probe connection, so a saturated pool does not
+    hold up or fail the probe.
+    """
+    if not get_state().completed:
+        return False
+    try:
+        get_pool().ping()
+    except (duckdb.Error, NotImplementedError):
+        logger.warning("Readiness probe could not reach the database", exc_info=True)
+        return False
+    return True
@@ -0,0 +1,149 @@
+"""Benchmark point lookups on the DuckDB and in-memory backends.
+
+Runs the three review lookups through ``app.queries`` with each backend and prints
+latency percentiles, followed by the in-memory store's memory footprint.
+
+    poetry --directory tp_api_project run python benchmarks/bench_backends.py
+    poetry --directory tp_api_project run python benchmarks/bench_backends.py --synthetic-rows 1000000
+"""
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import duckdb
+import pyarrow as pa
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from app import db, inmemory, queries  # noqa: E402
+from app.config import get_settings  # noqa: E402
+
+
+def _synthetic_database(rows: int, directory: str) -> str:
+    path = os.path.join(directory, "synthetic.duckdb")
+    with duckdb.connect(path) as con:
+        con.execute(
+            """
+            create table crt_tp_reviews as
+            select
+                'review-' || i as review_id,
+                'user-' || (hash(i) % ?) as reviewer_id,
+                'biz-' || (hash(i * 31) % ?) as business_id,
+                'Reviewer ' || (hash(i) % ?) as reviewer_name,
+                'Business ' || (hash(i * 31) % ?) as business_name,
+                'Title ' || i as review_title,
+                repeat('lorem ipsum ', 10) as review_content,
+                cast(i % 5 + 1 as integer) as review_rating,
+                '10.0.0.' || (i % 255) as review_ip_address,
+                'user' || (hash(i) % ?) || '@example.com' as email_address,
+                'GB' as reviewer_country,
+                date '2020-01-01' + cast(i % 1500 as integer) as review_date,
+                md5('review-' || i) as row_hash,
+                timestamp '2025-01-01' as loaded_at,
+                timestamp '2025-01-01' as updated_at,
+                false as is_deleted
+            from range(?) t(i)
+            """,
+            [rows // 5, rows // 500, rows // 5, rows // 500, rows // 5, rows],
+        )
+    return path
+
+
+def _configure(database_path: str, backend: str) -> None:
+    os.environ["TP_API_DUCKDB_PATH"] = database_path
+    os.environ["TP_API_DUCKDB_READ_ONLY"] = "true"
+    os.environ["TP_API_DB_BACKEND"] = backend
+    os.environ["TP_API_COALESCE_REQUESTS"] = "false"
+    get_settings.cache_clear()
+    db._POOL_CACHE.clear()
+    db._TABLE_SCHEMA_CACHE.clear()
+
+
+def _percentiles(samples: list[float]) -> str:
+    cuts = statistics.quantiles(samples, n=100)
+    return f"p50 {cuts[49]:>9.1f}  p95 {cuts[94]:>9.1f}  p99 {cuts[98]:>9.1f}"
+
+
+def _time_lookups(lookups: list[tuple]) -> list[float]:
+    timings = []
+    for fn, args in lookups:
+        started = time.perf_counter()
+        rows, _ = fn(*args)
+        for _ in rows:
+            pass
+        timings.append((time.perf_counter() - started) * 1_000_000)
+    return timings
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--database", default=str(PROJECT_ROOT.parent / "data" / "prod.duckdb"))
+    parser.add_argument("--synthetic-rows", type=int, default=0)
+    parser.add_argument("--lookups", type=int, default=2000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        database_path = args.database
+        if args.synthetic_rows:
+            database_path = _synthetic_database(args.synthetic_rows, directory)
+
+        with duckdb.connect(database_path, read_only=True) as con:
+            schema = con.execute(
+                "select table_schema from information_schema.tables "
+                "where table_name = 'crt_tp_reviews' limit 1"
+            ).fetchone()[0]
+            table = f'"{schema}".crt_tp_reviews'
+            row_count = con.execute(f"select count(*) from {table}").fetchone()[0]
+            businesses = [
+                r[0] for r in con.execute(f"select distinct business_id from {table}").fetchall()
+            ]
+            reviewers = [
+                r[0] for r in con.execute(f"select distinct reviewer_id from {table}").fetchall()
+            ]
+
+        rng = random.Random(7)
+        endpoints = {
+            "reviews_by_business": [
+                (queries.get_reviews_by_business, (rng.choice(businesses), 100, 0))
+                for _ in range(args.lookups)
+            ],
+            "reviews_by_user": [
+                (queries.get_reviews_by_user, (rng.choice(reviewers), 100, 0))
+                for _ in range(args.lookups)
+            ],
+            "user_info": [
+                (queries.get_user_info, (rng.choice(reviewers),)) for _ in range(args.lookups)
+            ],
+        }
+
+        print(f"{row_count} rows, {len(businesses)} businesses, {len(reviewers)} reviewers")
+        print("latency per lookup in microseconds")
+        for backend in ("duckdb", "inmemory"):
+            _configure(database_path, backend)
+            inmemory._STORE_CACHE.clear()
+            arrow_before = pa.total_allocated_bytes()
+            load_started = time.perf_counter()
+            if backend == "inmemory":
+                store = inmemory.get_review_store()
+                load_ms = (time.perf_counter() - load_started) * 1000
+                arrow_bytes = pa.total_allocated_bytes() - arrow_before
+            for name, lookups in endpoints.items():
+                _time_lookups(lookups[:50])
+                print(f"  {backend:<9} {name:<20} {_percentiles(_time_lookups(lookups))}")
+
+        print("in-memory footprint")
+        print(f"  load time              {load_ms:>12.1f} ms")
+        print(f"  arrow allocations      {arrow_bytes:>12,} bytes")
+        for key, value in store.memory_footprint().items():
+            print(f"  {key:<22} {value:>12,} bytes")
+
+
+if __name__ == "__main__":
+    main()
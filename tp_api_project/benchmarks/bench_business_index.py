@@ -0,0 +1,55 @@
+"""Benchmark business name prefix lookups on a large synthetic index.
+
+Builds a ``BusinessIndex`` over synthetic names and prints the build time plus lookup
+latency percentiles for prefixes of different widths, from one letter matching every
+name down to a single business.
+
+    poetry --directory tp_api_project run python benchmarks/bench_business_index.py
+    poetry --directory tp_api_project run python benchmarks/bench_business_index.py --rows 1000000
+"""
+
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from app.business_index import BusinessIndex, normalize_name  # noqa: E402
+
+_PREFIXES = ("b", "business 00", "business 0012", "business 0199999")
+
+
+def _percentiles(samples: list[float]) -> str:
+    cuts = statistics.quantiles(samples, n=100)
+    return f"p50 {cuts[49]:>9.1f}  p95 {cuts[94]:>9.1f}  p99 {cuts[98]:>9.1f}"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--lookups", type=int, default=2000)
+    parser.add_argument("--limit", type=int, default=10)
+    args = parser.parse_args()
+
+    rows = [
+        (f"biz-{i}", None, normalize_name(f"Business {i:07d}"), i % 997) for i in range(args.rows)
+    ]
+    started = time.perf_counter()
+    index = BusinessIndex(rows)
+    print(f"{index.size} names indexed in {(time.perf_counter() - started) * 1000:.1f} ms")
+
+    print("latency per lookup in microseconds")
+    for prefix in _PREFIXES:
+        timings = []
+        for _ in range(args.lookups):
+            started = time.perf_counter()
+            index.search(prefix, args.limit)
+            timings.append((time.perf_counter() - started) * 1_000_000)
+        print(f"  {prefix!r:<20} {_percentiles(timings)}")
+
+
+if __name__ == "__main__":
+    main()
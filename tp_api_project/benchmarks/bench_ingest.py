@@ -0,0 +1,101 @@
+"""Measure review ingestion throughput at different group-commit batch sizes.
+
+Producer threads submit single-review requests to a ``ReviewIngestor`` writing to a
+throwaway DuckDB file, the way concurrent ``POST /reviews`` calls would. Batch size 1
+is the one-transaction-per-row baseline. ``buffered`` producers fire and forget like
+the default 202 path; ``durable`` producers wait for each commit like ``wait=true``.
+
+    poetry --directory tp_api_project run python benchmarks/bench_ingest.py
+"""
+
+import argparse
+import sys
+import tempfile
+import threading
+import time
+from datetime import date
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from app.ingest import ReviewIngestor  # noqa: E402
+from app.schemas import ReviewIn  # noqa: E402
+
+
+def _reviews(count: int) -> list[ReviewIn]:
+    return [
+        ReviewIn(
+            review_id=f"bench-{i}",
+            reviewer_id=f"user-{i % 1000}",
+            business_id=f"biz-{i % 50}",
+            reviewer_name=f"Reviewer {i % 1000}",
+            business_name=f"Business {i % 50}",
+            review_title="Benchmark review",
+            review_content="lorem ipsum " * 10,
+            review_rating=i % 5 + 1,
+            review_ip_address="10.0.0.1",
+            email_address=f"user{i % 1000}@example.com",
+            reviewer_country="GB",
+            review_date=date(2025, 1, 1),
+        )
+        for i in range(count)
+    ]
+
+
+def _run(
+    mode: str,
+    batch_size: int,
+    flush_interval: float,
+    reviews: list[ReviewIn],
+    producers: int,
+    directory: str,
+) -> None:
+    ingestor = ReviewIngestor(
+        str(Path(directory) / f"ingest_{mode}_{batch_size}.duckdb"),
+        batch_size=batch_size,
+        flush_interval=flush_interval,
+        max_buffered_rows=len(reviews),
+    )
+    chunks = [reviews[i::producers] for i in range(producers)]
+
+    def produce(chunk: list[ReviewIn]) -> None:
+        for review in chunk:
+            committed = ingestor.submit([review])
+            if mode == "durable":
+                committed.result()
+
+    started = time.perf_counter()
+    threads = [threading.Thread(target=produce, args=(chunk,)) for chunk in chunks]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    ingestor.close()
+    elapsed = time.perf_counter() - started
+
+    print(
+        f"  {mode:<8}  batch {batch_size:>6}  {len(reviews) / elapsed:>10,.0f} rows/s"
+        f"  {ingestor.committed_batches:>6} commits  {elapsed:>7.2f} s"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=20000)
+    parser.add_argument("--producers", type=int, default=32)
+    parser.add_argument("--batch-sizes", default="1,10,100,500,2000")
+    parser.add_argument("--modes", default="buffered,durable")
+    parser.add_argument("--flush-interval", type=float, default=0.05)
+    args = parser.parse_args()
+
+    reviews = _reviews(args.rows)
+    print(f"{args.rows} single-review submissions from {args.producers} threads")
+    with tempfile.TemporaryDirectory() as directory:
+        for mode in args.modes.split(","):
+            for batch_size in (int(value) for value in args.batch_sizes.split(",")):
+                _run(mode, batch_size, args.flush_interval, reviews, args.producers, directory)
+
+
+if __name__ == "__main__":
+    main()
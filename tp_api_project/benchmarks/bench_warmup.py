@@ -0,0 +1,92 @@
+"""Compare cold and warm first-request latency for the review endpoints.
+
+Every sample runs in a fresh interpreter so DuckDB connections, the schema lookup in
+``qualify_table`` and the buffer manager all start cold; the only difference between
+the two modes is whether the lifespan warm-up ran before the first request.
+
+    poetry --directory tp_api_project run python benchmarks/bench_warmup.py
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+import duckdb
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+
+_CHILD = """
+import json, sys, time
+from fastapi.testclient import TestClient
+from app.main import app
+
+business_id, warm = sys.argv[1], sys.argv[2] == "warm"
+with TestClient(app) as client:
+    ready_started = time.perf_counter()
+    # Probing /readyz opens a connection, so only the warm mode waits on it.
+    while warm and client.get("/readyz").status_code != 200:
+        time.sleep(0.005)
+    ready_ms = (time.perf_counter() - ready_started) * 1000
+    timings = []
+    for _ in range(2):
+        started = time.perf_counter()
+        response = client.get("/reviews/by-business", params={"business_id": business_id})
+        assert response.status_code == 200, response.text
+        timings.append((time.perf_counter() - started) * 1000)
+print(json.dumps({"ready_ms": ready_ms, "first_ms": timings[0], "second_ms": timings[1]}))
+"""
+
+
+def _sample(database_path: str, business_id: str, warm: bool) -> dict:
+    env = dict(os.environ)
+    env.update(
+        {
+            "TP_API_DUCKDB_PATH": database_path,
+            "TP_API_WARMUP_ENABLED": "true" if warm else "false",
+            "TP_API_LOG_LEVEL": "WARNING",
+        }
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", _CHILD, business_id, "warm" if warm else "cold"],
+        cwd=PROJECT_ROOT,
+        env=env,
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--database", default=str(PROJECT_ROOT.parent / "data" / "prod.duckdb"))
+    parser.add_argument("--runs", type=int, default=7)
+    args = parser.parse_args()
+
+    with duckdb.connect(args.database, read_only=True) as con:
+        table = con.execute(
+            "select table_schema from information_schema.tables "
+            "where table_name = 'crt_tp_reviews' limit 1"
+        ).fetchone()[0]
+        business_id = con.execute(
+            f'select business_id from "{table}".crt_tp_reviews '
+            "group by 1 order by count(*) desc limit 1"
+        ).fetchone()[0]
+
+    print(f"{'mode':<6} {'ready ms':>10} {'1st req ms':>12} {'2nd req ms':>12}")
+    for warm in (False, True):
+        samples = [_sample(args.database, business_id, warm) for _ in range(args.runs)]
+        print(
+            f"{'warm' if warm else 'cold':<6} "
+            f"{statistics.median(s['ready_ms'] for s in samples):>10.2f} "
+            f"{statistics.median(s['first_ms'] for s in samples):>12.2f} "
+            f"{statistics.median(s['second_ms'] for s in samples):>12.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,79 @@
+import os
 import sys
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+# Keep the lifespan hook from touching the real DuckDB files while the suite runs.
+os.environ.setdefault("TP_API_WARMUP_ENABLED", "false")
+
+import duckdb  # noqa: E402
+import pytest  # noqa: E402
+from app import (  # noqa: E402
+    admission,
+    business_index,
+    coalescing,
+    db,
+    ingest,
+    inmemory,
+    slow_query_log,
+)
+from app.config import get_settings  # noqa: E402
+
+REVIEW_COUNT = 2500
+
+
+def reset_caches() -> None:
+    get_settings.cache_clear()
+    db._POOL_CACHE.clear()
+    db._TABLE_SCHEMA_CACHE.clear()
+    coalescing._SINGLE_FLIGHT_CACHE.clear()
+    admission._CONTROLLER_CACHE.clear()
+    slow_query_log._SLOW_QUERY_LOG_CACHE.clear()
+    inmemory._STORE_CACHE.clear()
+    business_index._INDEX_CACHE.clear()
+    ingest.close_ingestors()
+
+
+@pytest.fixture
+def review_db(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Point the API at a throwaway DuckDB file holding a synthetic crt_tp_reviews table."""
+    database_path = tmp_path / "reviews.duckdb"
+    with duckdb.connect(str(database_path)) as con:
+        con.execute(
+            """
+            create table crt_tp_reviews as
+            select
+                'review-' || i as review_id,
+                'user-' || (i % 7) as reviewer_id,
+                case when i < 2000 then 'biz-1' else 'biz-2' end as business_id,
+                'User ' || (i % 7) as reviewer_name,
+                'user' || (i % 7) || '@example.com' as email_address,
+                case when i % 7 = 0 then null else 'GB' end as reviewer_country,
+                cast(i % 5 + 1 as integer) as review_rating,
+                date '2024-01-01' + cast(i as integer) as review_date,
+                md5('review-' || i) as row_hash,
+                timestamp '2025-01-01' as loaded_at,
+                -- Batches of 100 rows share a watermark, like rows certified by one dbt run.
+                timestamp '2025-01-01' + to_minutes(i // 100) as updated_at,
+                i % 500 = 499 as is_deleted
+            from range(?) t(i)
+            """,
+            [REVIEW_COUNT],
+        )
+        con.execute("""
+            create table dim_business as
+            select * from (
+                values
+                    ('biz-1', 'Café Crème', 'cafe creme', 2000),
+                    ('biz-2', 'Cafeteria Co.', 'cafeteria co', 500),
+                    ('biz-3', 'Carpet World', 'carpet world', 40),
+                    ('biz-4', 'Nameless', null, 3)
+            ) t(business_id, business_name, name_key, review_count)
+            """)
+
+    monkeypatch.setenv("TP_API_DUCKDB_PATH", str(database_path))
+    monkeypatch.setenv("TP_API_DUCKDB_READ_ONLY", "true")
+    monkeypatch.setenv("TP_API_DB_POOL_SIZE", "2")
+    reset_caches()
+    yield database_path
+    reset_caches()
@@ -0,0 +1,163 @@
+import asyncio
+from pathlib import Path
+
+import pytest
+from app import admission, queries
+from app.admission import AdmissionController, Priority
+from app.config import get_settings
+from app.exceptions import AdmissionRejectedError
+from app.main import app
+from fastapi.testclient import TestClient
+from mockito import unstub, when
+
+
+@pytest.fixture(autouse=True)
+def _reset_state():
+    get_settings.cache_clear()
+    admission._CONTROLLER_CACHE.clear()
+    try:
+        yield
+    finally:
+        unstub()
+        get_settings.cache_clear()
+        admission._CONTROLLER_CACHE.clear()
+
+
+def _controller(**overrides) -> AdmissionController:
+    options = {
+        "max_concurrency": 1,
+        "max_queue": 2,
+        "queue_timeout": 1.0,
+        "client_max_concurrency": 0,
+        "client_rate": 0.0,
+        "client_burst": 1,
+    }
+    options.update(overrides)
+    return AdmissionController(**options)
+
+
+def test_interactive_requests_are_admitted_before_bulk() -> None:
+    async def scenario() -> list[str]:
+        controller = _controller()
+        await controller.acquire("a", Priority.INTERACTIVE)
+        order: list[str] = []
+
+        async def wait(name: str, priority: Priority) -> None:
+            await controller.acquire(name, priority)
+            order.append(name)
+            controller.release(name)
+
+        bulk = asyncio.create_task(wait("bulk", Priority.BULK))
+        await asyncio.sleep(0)
+        interactive = asyncio.create_task(wait("interactive", Priority.INTERACTIVE))
+        await asyncio.sleep(0)
+        assert controller.queue_depth == 2
+
+        controller.release("a")
+        await asyncio.gather(bulk, interactive)
+        return order
+
+    assert asyncio.run(scenario()) == ["interactive", "bulk"]
+
+
+def test_full_queue_sheds_bulk_before_interactive() -> None:
+    async def scenario() -> None:
+        controller = _controller(max_queue=1)
+        await controller.acquire("a", Priority.INTERACTIVE)
+        bulk = asyncio.create_task(controller.acquire("bulk", Priority.BULK))
+        await asyncio.sleep(0)
+
+        interactive = asyncio.create_task(controller.acquire("interactive", Priority.INTERACTIVE))
+        await asyncio.sleep(0)
+        with pytest.raises(AdmissionRejectedError) as preempted:
+            await bulk
+        assert preempted.value.context == {"reason": "preempted"}
+
+        with pytest.raises(AdmissionRejectedError) as rejected:
+            await controller.acquire("late", Priority.INTERACTIVE)
+        assert rejected.value.status_code == 503
+
+        controller.release("a")
+        await interactive
+        assert controller.in_flight == 1
+
+    asyncio.run(scenario())
+
+
+def test_cancelled_waiter_is_not_preempted() -> None:
+    async def scenario() -> None:
+        controller = _controller(max_queue=1)
+        await controller.acquire("a", Priority.INTERACTIVE)
+        bulk = asyncio.create_task(controller.acquire("bulk", Priority.BULK))
+        await asyncio.sleep(0)
+        asyncio.get_running_loop().call_later(0.05, controller.release, "a")
+        bulk.cancel()
+
+        # Queue before the cancelled task gets to run its own cleanup.
+        await controller.acquire("interactive", Priority.INTERACTIVE)
+        with pytest.raises(asyncio.CancelledError):
+            await bulk
+        assert controller.in_flight == 1
+        assert controller.queue_depth == 0
+        assert 'tp_api_admission_shed_total{reason="preempted"} 0' in controller.render_metrics()
+
+    asyncio.run(scenario())
+
+
+def test_queued_request_is_shed_at_its_deadline() -> None:
+    async def scenario() -> None:
+        controller = _controller(queue_timeout=0.05)
+        await controller.acquire("a", Priority.INTERACTIVE)
+        with pytest.raises(AdmissionRejectedError) as rejected:
+            await controller.acquire("b", Priority.INTERACTIVE)
+        assert rejected.value.context == {"reason": "deadline"}
+        assert controller.queue_depth == 0
+        assert 'tp_api_admission_shed_total{reason="deadline"} 1' in controller.render_metrics()
+
+    asyncio.run(scenario())
+
+
+def test_rate_limited_client_receives_retry_after(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("TP_API_ADMISSION_CLIENT_RATE", "0.5")
+    monkeypatch.setenv("TP_API_ADMISSION_CLIENT_BURST", "1")
+    monkeypatch.setenv("TP_API_ADMISSION_CLIENT_API_KEYS", "partner")
+    when(queries).get_user_info("user-1").thenReturn(([("user-1",)], ["reviewer_id"]))
+
+    with TestClient(app) as client:
+        first = client.get("/users/user-1")
+        second = client.get("/users/user-1")
+        unknown_key = client.get("/users/user-1", headers={"X-API-Key": "made-up"})
+        other_client = client.get("/users/user-1", headers={"X-API-Key": "partner"})
+        metrics = client.get("/metrics")
+
+    assert first.status_code == 200
+    assert second.status_code == 429
+    assert second.headers["Retry-After"] == "2"
+    assert second.json()["context"]["reason"] == "rate_limited"
+    assert unknown_key.status_code == 429
+    assert other_client.status_code == 200
+    assert 'tp_api_admission_shed_total{reason="rate_limited"} 2' in metrics.text
+    assert "tp_api_admission_in_flight 0" in metrics.text
+
+
+def test_concurrency_defaults_to_pool_size(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("TP_API_DB_POOL_SIZE", "3")
+    monkeypatch.delenv("TP_API_ADMISSION_MAX_CONCURRENCY", raising=False)
+
+    assert get_settings().admission_max_concurrency == 3
+
+
+def test_only_pooled_lookups_go_through_admission(review_db: Path) -> None:
+    when(queries).get_user_info("user-1").thenReturn(([("user-1",)], ["reviewer_id"]))
+
+    with TestClient(app) as client:
+        businesses = client.get("/businesses", params={"prefix": "caf"})
+        client.post("/reviews", json=[])
+        before = client.get("/metrics").text
+        user = client.get("/users/user-1")
+        after = client.get("/metrics").text
+
+    assert businesses.status_code == 200
+    assert "tp_api_admission_admitted_total 0" in before
+    assert user.status_code == 200
+    assert "tp_api_admission_admitted_total 1" in after
@@ -0,0 +1,90 @@
+import csv
+import io
+import re
+from pathlib import Path
+
+import duckdb
+import pytest
+from app.business_index import BusinessIndex, normalize_name
+from app.main import app
+from fastapi.testclient import TestClient
+
+
+@pytest.fixture
+def client(review_db: Path, monkeypatch: pytest.MonkeyPatch) -> TestClient:
+    monkeypatch.setenv("TP_API_ADMISSION_ENABLED", "false")
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+def _ids(text: str) -> list[str]:
+    return [row["business_id"] for row in csv.DictReader(io.StringIO(text))]
+
+
+def test_prefix_lookup_ranks_by_review_count(client: TestClient) -> None:
+    response = client.get("/businesses", params={"prefix": "Ca"})
+
+    assert response.status_code == 200
+    assert response.text.splitlines()[0] == "business_id,business_name,review_count"
+    assert _ids(response.text) == ["biz-1", "biz-2", "biz-3"]
+
+
+@pytest.mark.parametrize(
+    ("prefix", "expected"),
+    [("CAFÉ", ["biz-1", "biz-2"]), ("cafe-cr", ["biz-1"]), ("carp", ["biz-3"])],
+)
+def test_prefix_lookup_ignores_case_accents_and_punctuation(
+    client: TestClient, prefix: str, expected: list[str]
+) -> None:
+    response = client.get("/businesses", params={"prefix": prefix, "limit": 5})
+    assert _ids(response.text) == expected
+
+
+def test_unknown_prefix_is_not_found(client: TestClient) -> None:
+    response = client.get("/businesses", params={"prefix": "zz"})
+    assert response.status_code == 404
+    assert response.json()["detail"] == "No businesses match the requested prefix."
+
+
+_NAME_KEY_MACRO = Path(__file__).resolve().parents[2] / "tp_data_project/macros/name_key.sql"
+
+
+def test_normalize_name_matches_the_dbt_name_key_macro() -> None:
+    if not _NAME_KEY_MACRO.exists():
+        pytest.skip("dbt project is not available next to the API")
+    macro = re.sub(r"\{#.*?#\}|\{%.*?%\}", "", _NAME_KEY_MACRO.read_text(), flags=re.S)
+    expression = macro.strip().replace("{{ column }}", "name")
+    names = [
+        "Café Crème",
+        "Łódź Bakery",
+        "Straße & Co.",
+        "ﬁne Foods",
+        "½ Price Deals",
+        "東京寿司",
+        "ΟΔΟΣ Ελληνικά",
+        "서울 치킨",
+        "İstanbul Kebap",
+        "Ñandú_Shop",
+        "हिन्दी किताब",
+        "---",
+    ]
+
+    with duckdb.connect() as connection:
+        expected = connection.execute(
+            f"select name, coalesce({expression}, '') from unnest(?) as names(name)", [names]
+        ).fetchall()
+
+    assert [(name, normalize_name(name)) for name, _ in expected] == expected
+    assert normalize_name("Łódź Bakery") == "łodz bakery"
+
+
+def test_large_index_finds_every_prefix_width() -> None:
+    rows = [
+        (f"biz-{i}", None, normalize_name(f"Business {i:07d}"), i % 997) for i in range(200_000)
+    ]
+    index = BusinessIndex(rows)
+
+    for prefix in ("b", "business 00", "business 0012", "business 0199999"):
+        found, _ = index.search(prefix, 10)
+        assert found
+    assert index.search("business 001", 3)[0][0][2] == 996
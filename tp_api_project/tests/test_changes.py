@@ -0,0 +1,64 @@
+import csv
+import io
+from pathlib import Path
+
+import pytest
+from app.main import app
+from fastapi.testclient import TestClient
+
+
+@pytest.fixture
+def client(review_db: Path, monkeypatch: pytest.MonkeyPatch) -> TestClient:
+    monkeypatch.setenv("TP_API_ADMISSION_ENABLED", "false")
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+def _rows(text: str) -> list[dict[str, str]]:
+    return list(csv.DictReader(io.StringIO(text)))
+
+
+def test_keyset_pages_cover_every_change_once(client: TestClient) -> None:
+    seen: list[dict[str, str]] = []
+    params: dict[str, str | int] = {"limit": 250}
+    while True:
+        response = client.get("/reviews/changes", params=params)
+        assert response.status_code == 200
+        page = _rows(response.text)
+        if not page:
+            break
+        seen.extend(page)
+        # Pages of 250 split the fixture's 100-row watermark groups, exercising the tie-break.
+        params = {"since": page[-1]["updated_at"], "after_id": page[-1]["review_id"], "limit": 250}
+
+    assert len(seen) == 2500
+    assert len({row["review_id"] for row in seen}) == 2500
+    keys = [(row["updated_at"], row["review_id"]) for row in seen]
+    assert keys == sorted(keys)
+    tombstones = [row["review_id"] for row in seen if row["is_deleted"] == "True"]
+    assert tombstones == [f"review-{i}" for i in range(499, 2500, 500)]
+    assert "row_hash" not in seen[0]
+
+
+@pytest.mark.parametrize("since", ["2025-01-01T00:23:00", "2025-01-01T01:23:00+01:00"])
+def test_since_returns_only_later_rows(client: TestClient, since: str) -> None:
+    response = client.get("/reviews/changes", params={"since": since})
+
+    rows = _rows(response.text)
+    assert response.status_code == 200
+    assert len(rows) == 100
+    assert {row["updated_at"] for row in rows} == {"2025-01-01 00:24:00"}
+
+
+def test_after_id_requires_since(client: TestClient) -> None:
+    response = client.get("/reviews/changes", params={"after_id": "review-1"})
+    assert response.status_code == 422
+
+
+def test_lookups_hide_tombstones(client: TestClient) -> None:
+    response = client.get("/reviews/by-business", params={"business_id": "biz-2", "limit": 1000})
+
+    rows = _rows(response.text)
+    assert len(rows) == 499
+    assert "review-2499" not in {row["review_id"] for row in rows}
+    assert not {"updated_at", "is_deleted"} & set(rows[0])
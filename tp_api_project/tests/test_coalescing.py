@@ -0,0 +1,116 @@
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+import pytest
+from app import db, queries
+from app.coalescing import SingleFlight
+from app.exceptions import RecordNotFoundError
+from app.main import app
+from fastapi.testclient import TestClient
+
+
+def test_identical_concurrent_requests_share_one_connection(
+    review_db: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("TP_API_ADMISSION_ENABLED", "false")
+    acquisitions = 0
+    original_acquire = db.DuckDBConnectionPool.acquire
+
+    @contextmanager
+    def counting_acquire(self):
+        nonlocal acquisitions
+        acquisitions += 1
+        with original_acquire(self) as connection:
+            yield connection
+
+    original_query = queries._query_reviews_by_business
+
+    def slow_query(*args):
+        # Hold the leader long enough for every follower to join its flight.
+        time.sleep(0.3)
+        return original_query(*args)
+
+    monkeypatch.setattr(db.DuckDBConnectionPool, "acquire", counting_acquire)
+    monkeypatch.setattr(queries, "_query_reviews_by_business", slow_query)
+
+    request_count = 8
+    barrier = threading.Barrier(request_count)
+    responses = [None] * request_count
+
+    with TestClient(app) as client:
+
+        def fetch(index: int) -> None:
+            barrier.wait()
+            responses[index] = client.get(
+                "/reviews/by-business",
+                params={"business_id": "biz-1", "limit": 1000},
+            )
+
+        threads = [threading.Thread(target=fetch, args=(i,)) for i in range(request_count)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    assert acquisitions == 1
+    assert all(response.status_code == 200 for response in responses)
+    bodies = {response.text for response in responses}
+    assert len(bodies) == 1
+    assert len(bodies.pop().splitlines()) == 1001
+
+
+def test_follower_disconnect_does_not_disturb_other_subscribers() -> None:
+    closed = threading.Event()
+
+    def rows():
+        try:
+            for i in range(10):
+                yield (i,)
+        finally:
+            closed.set()
+
+    single_flight = SingleFlight(batch_size=3, max_buffered_batches=2, timeout=1.0)
+    leader_rows, header = single_flight.do("key", lambda: (rows(), ["n"]))
+    follower_rows, _ = single_flight.do("key", lambda: pytest.fail("follower must not execute"))
+
+    assert next(follower_rows) == (0,)
+    follower_rows.close()
+    assert not closed.is_set()
+
+    assert header == ["n"]
+    assert [row[0] for row in leader_rows] == list(range(10))
+    assert closed.is_set()
+
+
+def test_leader_failure_propagates_to_followers() -> None:
+    release = threading.Event()
+    error = RecordNotFoundError("No reviews were found for the requested business.")
+
+    def failing_query():
+        release.wait(timeout=1.0)
+        raise error
+
+    single_flight = SingleFlight(batch_size=3, max_buffered_batches=2, timeout=1.0)
+    outcomes: list[BaseException] = []
+
+    def call() -> None:
+        try:
+            single_flight.do("key", failing_query)
+        except RecordNotFoundError as exc:
+            outcomes.append(exc)
+
+    threads = [threading.Thread(target=call) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    time.sleep(0.1)
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert len(outcomes) == 3
+    assert sum(exc is error for exc in outcomes) == 1
+    followers = [exc for exc in outcomes if exc is not error]
+    assert all(exc == error and exc.__cause__ is error for exc in followers)
+    assert followers[0] is not followers[1]
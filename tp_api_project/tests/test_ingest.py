@@ -0,0 +1,114 @@
+from pathlib import Path
+
+import duckdb
+import pytest
+from app import ingest
+from app.ingest import ReviewIngestor
+from app.main import app
+from app.schemas import ReviewIn
+from fastapi.testclient import TestClient
+
+
+def _review(index: int, **overrides) -> dict:
+    review = {
+        "review_id": f"new-{index}",
+        "reviewer_id": "user-1",
+        "business_id": "biz-1",
+        "reviewer_name": " New Reviewer ",
+        "review_rating": 4,
+        "email_address": "new@example.com",
+        "review_date": "2025-01-31",
+    }
+    review.update(overrides)
+    return review
+
+
+def _landed(database_path: Path) -> list[tuple]:
+    with duckdb.connect(str(database_path), read_only=True) as con:
+        return con.execute(
+            "select review_id, reviewer_name, batch_id from LANDING.lnd_tp_reviews order by review_id"
+        ).fetchall()
+
+
+@pytest.fixture
+def writable_db(review_db: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    monkeypatch.setenv("TP_API_DUCKDB_READ_ONLY", "false")
+    monkeypatch.setenv("TP_API_INGEST_ENABLED", "true")
+    monkeypatch.setenv("TP_API_ADMISSION_ENABLED", "false")
+    return review_db
+
+
+def test_reviews_are_group_committed_in_one_batch(tmp_path: Path) -> None:
+    database_path = tmp_path / "ingest.duckdb"
+    ingestor = ReviewIngestor(
+        str(database_path), batch_size=5, flush_interval=30.0, max_buffered_rows=100
+    )
+    futures = [ingestor.submit([ReviewIn.model_validate(_review(i))]) for i in range(5)]
+    batch_ids = {future.result(timeout=5) for future in futures}
+    straggler = ingestor.submit([ReviewIn.model_validate(_review(5))])
+    ingestor.close()
+
+    assert len(batch_ids) == 1
+    assert straggler.result(timeout=0) not in batch_ids
+    assert ingestor.committed_batches == 2
+    landed = _landed(database_path)
+    assert [row[0] for row in landed] == [f"new-{i}" for i in range(6)]
+    assert landed[0][1] == "New Reviewer"
+
+
+def test_full_buffer_rejects_new_reviews(tmp_path: Path) -> None:
+    ingestor = ReviewIngestor(
+        str(tmp_path / "ingest.duckdb"), batch_size=10, flush_interval=30.0, max_buffered_rows=10
+    )
+    try:
+        ingestor.submit([ReviewIn.model_validate(_review(i)) for i in range(8)])
+        with pytest.raises(ingest.DataAccessError) as rejected:
+            ingestor.submit([ReviewIn.model_validate(_review(i)) for i in range(8, 11)])
+        assert rejected.value.status_code == 503
+    finally:
+        ingestor.close()
+    assert ingestor.committed_rows == 8
+
+
+def test_post_reviews_acknowledges_buffered_and_committed_writes(writable_db: Path) -> None:
+    with TestClient(app) as client:
+        committed = client.post("/reviews", params={"wait": "true"}, json=_review(1))
+        buffered = client.post("/reviews", json=[_review(2), _review(3)])
+
+    assert committed.status_code == 201
+    assert committed.json()["status"] == "committed"
+    assert buffered.status_code == 202
+    assert buffered.json() == {"accepted": 2, "status": "buffered", "batch_id": None}
+
+    # Shutting the app down flushes the buffered reviews.
+    landed = _landed(writable_db)
+    assert [row[0] for row in landed] == ["new-1", "new-2", "new-3"]
+    assert landed[0][2] == committed.json()["batch_id"]
+
+
+@pytest.mark.parametrize(
+    "payload",
+    [
+        _review(1, review_rating=6),
+        _review(1, review_id=""),
+        _review(1, email_address="not-an-email"),
+        _review(1, unexpected="field"),
+        [],
+    ],
+)
+def test_post_reviews_validates_the_certified_contract(writable_db: Path, payload) -> None:
+    with TestClient(app) as client:
+        response = client.post("/reviews", json=payload)
+    assert response.status_code == 422
+
+
+def test_post_reviews_requires_write_mode(review_db: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    with TestClient(app) as client:
+        disabled = client.post("/reviews", json=_review(1))
+        monkeypatch.setenv("TP_API_INGEST_ENABLED", "true")
+        ingest.get_settings.cache_clear()
+        read_only = client.post("/reviews", json=_review(1))
+
+    assert disabled.status_code == 404
+    assert read_only.status_code == 503
+    assert "TP_API_DUCKDB_READ_ONLY" in read_only.json()["detail"]
@@ -0,0 +1,76 @@
+from pathlib import Path
+
+import pytest
+from app import inmemory, queries
+from app.exceptions import RecordNotFoundError
+from app.main import app
+from fastapi.testclient import TestClient
+
+
+@pytest.fixture
+def inmemory_backend(review_db: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    monkeypatch.setenv("TP_API_DB_BACKEND", "inmemory")
+    inmemory._STORE_CACHE.clear()
+    yield review_db
+    inmemory._STORE_CACHE.clear()
+
+
+def _duckdb_result(monkeypatch: pytest.MonkeyPatch, fn, *args) -> tuple[list, list]:
+    with monkeypatch.context() as patch:
+        patch.setattr(queries, "_use_store", lambda: False)
+        rows, header = fn(*args)
+        return list(rows), header
+
+
+@pytest.mark.parametrize(
+    ("fn", "args"),
+    [
+        (queries.get_reviews_by_business, ("biz-1", 100, 0)),
+        (queries.get_reviews_by_business, ("biz-2", 1000, 450)),
+        (queries.get_reviews_by_user, ("user-3", 50, 20)),
+        (queries.get_reviews_by_user, ("user-0", 1000, 0)),
+    ],
+)
+def test_inmemory_matches_duckdb(
+    inmemory_backend: Path, monkeypatch: pytest.MonkeyPatch, fn, args
+) -> None:
+    expected_rows, expected_header = _duckdb_result(monkeypatch, fn, *args)
+    rows, header = fn(*args)
+
+    assert header == expected_header
+    assert list(rows) == expected_rows
+
+
+def test_inmemory_user_info_matches_duckdb(
+    inmemory_backend: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    expected_rows, expected_header = _duckdb_result(monkeypatch, queries.get_user_info, "user-0")
+    rows, header = queries.get_user_info("user-0")
+
+    assert header == expected_header
+    assert (
+        sorted(rows) == sorted(expected_rows) == [("user-0", "User 0", "user0@example.com", None)]
+    )
+
+
+def test_inmemory_not_found(inmemory_backend: Path) -> None:
+    with pytest.raises(RecordNotFoundError):
+        queries.get_reviews_by_business("missing", 100, 0)
+    with pytest.raises(RecordNotFoundError):
+        queries.get_reviews_by_user("user-1", 100, 10_000)
+
+
+def test_warmup_loads_store_before_ready(
+    inmemory_backend: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("TP_API_WARMUP_ENABLED", "true")
+
+    with TestClient(app) as client:
+        response = client.get("/reviews/by-business", params={"business_id": "biz-2"})
+
+    [store] = inmemory._STORE_CACHE.values()
+    # The fixture's five tombstones are not loaded.
+    assert store.num_rows == 2495
+    assert store.memory_footprint()["columns_bytes"] > 0
+    assert response.status_code == 200
+    assert len(response.text.splitlines()) == 101
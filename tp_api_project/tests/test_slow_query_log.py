@@ -0,0 +1,96 @@
+from pathlib import Path
+
+import duckdb
+import pytest
+from app import queries
+from app.config import get_settings
+from app.main import app
+from app.slow_query_log import SlowQueryLog, _params_hash, fingerprint, get_slow_query_log
+from fastapi.testclient import TestClient
+
+
+def _drain(result) -> list:
+    rows, _ = result
+    return list(rows)
+
+
+def test_sampled_query_captures_profile(review_db: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("TP_API_SLOW_QUERY_SAMPLE_RATE", "1")
+    monkeypatch.setenv("TP_API_COALESCE_REQUESTS", "false")
+
+    rows = _drain(queries.get_reviews_by_user("user-3", limit=1000))
+
+    assert len(rows) == 357
+    [entry] = get_slow_query_log().entries()
+    assert entry.query_name == "reviews_by_user"
+    assert entry.reason == "sampled"
+    assert entry.rows_returned == 357
+    assert entry.rows_scanned and entry.rows_scanned >= 357
+    assert entry.plan is not None and entry.plan["children"]
+    assert "user-3" not in entry.model_dump_json()
+
+
+def test_slow_query_is_profiled_on_next_execution(
+    review_db: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("TP_API_SLOW_QUERY_MS", "0")
+    monkeypatch.setenv("TP_API_COALESCE_REQUESTS", "false")
+
+    first = _drain(queries.get_reviews_by_business("biz-1", limit=1000))
+    second = _drain(queries.get_reviews_by_business("biz-1", limit=1000))
+
+    assert first == second
+    newest, oldest = get_slow_query_log().entries()
+    assert oldest.plan is None and oldest.rows_scanned is None
+    assert newest.plan is not None
+    assert newest.fingerprint == oldest.fingerprint
+    assert newest.params_hash == oldest.params_hash
+
+
+def test_debug_endpoint_requires_token(review_db: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("TP_API_SLOW_QUERY_MS", "0")
+    with TestClient(app) as client:
+        assert client.get("/debug/slow-queries").status_code == 404
+
+    monkeypatch.setenv("TP_API_DEBUG_TOKEN", "s3cret")
+    get_settings.cache_clear()
+    with TestClient(app) as client:
+        client.get("/reviews/by-user", params={"user_id": "user-1"})
+        unauthorised = client.get("/debug/slow-queries", headers={"Authorization": "Bearer wrong"})
+        authorised = client.get("/debug/slow-queries", headers={"Authorization": "Bearer s3cret"})
+
+    assert unauthorised.status_code == 401
+    assert authorised.status_code == 200
+    [entry] = authorised.json()
+    assert entry["query_name"] == "reviews_by_user"
+    assert entry["reason"] == "threshold"
+
+
+def test_profile_flag_is_kept_for_the_slow_parameters(
+    review_db: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("TP_API_SLOW_QUERY_MS", "0")
+    monkeypatch.setenv("TP_API_COALESCE_REQUESTS", "false")
+
+    _drain(queries.get_reviews_by_business("biz-1", limit=1000))
+    _drain(queries.get_reviews_by_business("biz-2", limit=1000))
+    _drain(queries.get_reviews_by_business("biz-1", limit=1000))
+
+    profiled, other, slow = get_slow_query_log().entries()
+    assert other.plan is None and other.params_hash != slow.params_hash
+    assert profiled.plan is not None
+    assert profiled.params_hash == slow.params_hash
+
+
+def test_flagged_run_is_recorded_even_when_fast() -> None:
+    slow_query_log = SlowQueryLog(threshold_ms=60_000, sample_rate=0.0, max_entries=10)
+    sql = "select range as n from range(?)"
+    slow_query_log._pending_profiles[(fingerprint(sql), _params_hash([5]))] = None
+
+    with duckdb.connect() as connection:
+        _, header, rows = slow_query_log.execute(connection, "numbers", sql, [5], batch_size=10)
+
+    assert header == ["n"] and len(rows) == 5
+    [entry] = slow_query_log.entries()
+    assert entry.reason == "threshold"
+    assert entry.plan is not None
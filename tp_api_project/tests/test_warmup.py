@@ -0,0 +1,73 @@
+import time
+from pathlib import Path
+
+import duckdb
+import pytest
+from app import db, warmup
+from app.main import app
+from fastapi.testclient import TestClient
+
+
+def _wait_until_ready(client: TestClient, timeout: float = 5.0):
+    deadline = time.monotonic() + timeout
+    while True:
+        response = client.get("/readyz")
+        if response.status_code == 200 or time.monotonic() > deadline:
+            return response
+        time.sleep(0.01)
+
+
+def test_readyz_passes_after_warmup(review_db: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("TP_API_WARMUP_ENABLED", "true")
+    monkeypatch.setenv("TP_API_DB_POOL_MIN_SIZE", "2")
+
+    with TestClient(app) as client:
+        response = _wait_until_ready(client)
+
+    assert response.status_code == 200
+    assert response.json() == {"status": "ok"}
+    state = warmup.get_state()
+    assert state.completed and state.error is None
+    pool = db.get_pool()
+    assert pool._active_connections == 2
+    assert (str(review_db), "crt_tp_reviews") in db._TABLE_SCHEMA_CACHE
+
+
+def test_readyz_fails_when_warmup_fails(review_db: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("TP_API_WARMUP_ENABLED", "true")
+    monkeypatch.setenv("TP_API_WARMUP_QUERIES", "select missing_column from {crt_tp_reviews}")
+
+    with TestClient(app) as client:
+        response = _wait_until_ready(client, timeout=0.5)
+
+    assert response.status_code == 503
+    assert response.json() == {"status": "fail"}
+    assert "missing_column" in (warmup.get_state().error or "")
+
+
+def test_readiness_probe_does_not_wait_for_a_busy_pool(
+    review_db: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("TP_API_DB_POOL_SIZE", "1")
+    monkeypatch.setenv("TP_API_DB_POOL_TIMEOUT", "5")
+    warmup._set_state(warmup.WarmupState(completed=True))
+
+    with db.get_connection():
+        started = time.monotonic()
+        assert warmup.is_ready()
+        assert time.monotonic() - started < 1.0
+
+
+def test_missing_business_dimension_does_not_block_readiness(
+    review_db: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("TP_API_WARMUP_ENABLED", "true")
+    with duckdb.connect(str(review_db)) as connection:
+        connection.execute("drop table dim_business")
+
+    with TestClient(app) as client:
+        response = _wait_until_ready(client)
+        lookup = client.get("/businesses", params={"prefix": "caf"})
+
+    assert response.status_code == 200
+    assert lookup.status_code == 500
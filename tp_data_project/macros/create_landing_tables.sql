@@ -0,0 +1,22 @@
+{% macro create_landing_tables() -%}
+
+    {#- Landing table written by the API's POST /reviews group commits.
+        Keep in sync with app/ingest.py in tp_api_project. -#}
+    create table if not exists LANDING.lnd_tp_reviews (
+        review_id varchar not null,
+        reviewer_id varchar not null,
+        business_id varchar not null,
+        reviewer_name varchar,
+        business_name varchar,
+        review_title varchar,
+        review_content varchar,
+        review_rating integer,
+        review_ip_address varchar,
+        email_address varchar,
+        reviewer_country varchar,
+        review_date date not null,
+        batch_id varchar not null,
+        ingested_at timestamptz not null
+    )
+
+{%- endmacro %}
@@ -0,0 +1,8 @@
+{% macro name_key(column) -%}
+
+    {#- Lowercased, accent-stripped and with every run of characters other than letters and
+        digits collapsed to one space. Keep in sync with normalize_name in
+        tp_api_project/app/business_index.py. -#}
+    nullif(trim(regexp_replace(lower(strip_accents({{ column }})), '[^\p{L}\p{N}]+', ' ', 'g')), '')
+
+{%- endmacro %}
@@ -1,32 +1,135 @@
+{{
+    config(
+        materialized='incremental',
+        unique_key='review_id',
+        incremental_strategy='delete+insert',
+        on_schema_change='fail'
+    )
+}}
+
+{#- Watermarks are naive UTC timestamps so clients without tz support can compare them. -#}
+{% set run_timestamp = "timezone('UTC', current_timestamp)" %}
+
 with ranked_reviews as (
     select
         *,
+        -- The latest landed submission of a review_id wins, even over a later review_date,
+        -- so corrections sent through the API replace the row. Seed rows have no
+        -- ingested_at and lose to any landed row. The row text settles any remaining tie
+        -- so the same row wins on every run.
         row_number() over (
             partition by review_id
-            order by review_date desc nulls last, reviewer_id asc, business_id asc
+            order by
+                ingested_at desc nulls last,
+                review_date desc nulls last,
+                reviewer_id asc,
+                business_id asc,
+                cast(
+                    row(
+                        reviewer_name,
+                        business_name,
+                        review_title,
+                        review_content,
+                        review_rating,
+                        review_ip_address,
+                        email_address,
+                        reviewer_country
+                    ) as varchar
+                ) asc
         ) as review_rank
     from {{ ref('stg_tp_reviews') }}
     where review_id is not null
+),
+
+certified_reviews as (
+    select
+        review_id,
+        reviewer_id,
+        business_id,
+
+        review_date,
+        nullif(trim(reviewer_name), '') as reviewer_name,
+        nullif(trim(business_name), '') as business_name,
+        nullif(trim(review_title), '') as review_title,
+
+        nullif(trim(review_content), '') as review_content,
+
+        case
+            when review_rating between 1 and 5 then review_rating
+        end as review_rating,
+        trim(review_ip_address) as review_ip_address,
+        lower(trim(email_address)) as email_address,
+
+        upper(nullif(trim(reviewer_country), '')) as reviewer_country
+    from ranked_reviews
+    where review_rank = 1
+),
+
+hashed_reviews as (
+    select
+        *,
+        md5(
+            cast(
+                row(
+                    reviewer_id,
+                    business_id,
+                    review_date,
+                    reviewer_name,
+                    business_name,
+                    review_title,
+                    review_content,
+                    review_rating,
+                    review_ip_address,
+                    email_address,
+                    reviewer_country
+                ) as varchar
+            )
+        ) as row_hash
+    from certified_reviews
 )
 
-select
-    review_id,
-    reviewer_id,
-    business_id,
+{% if is_incremental() %}
+
+    , changed_reviews as (
+        select
+            hashed_reviews.*,
+            coalesce(existing.loaded_at, {{ run_timestamp }}) as loaded_at,
+            {{ run_timestamp }} as updated_at,
+            false as is_deleted
+        from hashed_reviews
+        left join {{ this }} as existing
+            on hashed_reviews.review_id = existing.review_id
+        where
+            existing.review_id is null
+            or existing.is_deleted
+            or existing.row_hash != hashed_reviews.row_hash
+    ),
 
-    review_date,
-    nullif(trim(reviewer_name), '') as reviewer_name,
-    nullif(trim(business_name), '') as business_name,
-    nullif(trim(review_title), '') as review_title,
+    -- Reviews that drop out of the source, such as duplicates removed upstream, stay as
+    -- tombstones so change-feed consumers learn to delete them.
+    removed_reviews as (
+        select existing.* replace ({{ run_timestamp }} as updated_at, true as is_deleted)
+        from {{ this }} as existing
+        where
+            not existing.is_deleted
+            and not exists (
+                select 1
+                from hashed_reviews
+                where hashed_reviews.review_id = existing.review_id
+            )
+    )
 
-    nullif(trim(review_content), '') as review_content,
+    select * from changed_reviews
+    union all by name
+    select * from removed_reviews
 
-    case
-        when review_rating between 1 and 5 then review_rating
-    end as review_rating,
-    trim(review_ip_address) as review_ip_address,
-    lower(trim(email_address)) as email_address,
+{% else %}
+
+    select
+        *,
+        {{ run_timestamp }} as loaded_at,
+        {{ run_timestamp }} as updated_at,
+        false as is_deleted
+    from hashed_reviews
 
-    upper(nullif(trim(reviewer_country), '')) as reviewer_country
-from ranked_reviews
-where review_rank = 1
+{% endif %}
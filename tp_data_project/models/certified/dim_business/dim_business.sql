@@ -0,0 +1,52 @@
+with live_reviews as (
+    select
+        business_id,
+        business_name,
+        review_date
+    from {{ ref('crt_tp_reviews') }}
+    where not is_deleted
+),
+
+name_counts as (
+    select
+        business_id,
+        business_name,
+        count(*) as name_review_count,
+        max(review_date) as name_last_review_date
+    from live_reviews
+    where business_name is not null
+    group by business_id, business_name
+),
+
+-- A business can be reviewed under slightly different spellings; keep the most used one.
+canonical_names as (
+    select
+        business_id,
+        business_name
+    from name_counts
+    qualify row_number() over (
+        partition by business_id
+        order by name_review_count desc, name_last_review_date desc, business_name asc
+    ) = 1
+),
+
+review_counts as (
+    select
+        business_id,
+        count(*) as review_count,
+        max(review_date) as last_review_date
+    from live_reviews
+    group by business_id
+)
+
+select
+    review_counts.business_id,
+    canonical_names.business_name,
+    -- Normalised so prefix search is a range scan.
+    {{ name_key('canonical_names.business_name') }} as name_key,
+    review_counts.review_count,
+    review_counts.last_review_date
+from review_counts
+left join canonical_names
+    on review_counts.business_id = canonical_names.business_id
+order by name_key, review_counts.review_count desc, review_counts.business_id
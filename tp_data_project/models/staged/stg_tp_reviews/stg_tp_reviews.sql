@@ -10,5 +10,24 @@ select
     trim("Business Name") as business_name,
     trim("Email Address") as email_address,
     trim("Reviewer Country") as reviewer_country,
-    try_cast("Review Date" as date) as review_date
+    try_cast("Review Date" as date) as review_date,
+    cast(null as timestamptz) as ingested_at
 from {{ ref('tp_reviews') }}
+
+union all
+
+select
+    review_id,
+    review_rating,
+    review_content,
+    review_ip_address,
+    business_id,
+    reviewer_id,
+    reviewer_name,
+    review_title,
+    business_name,
+    email_address,
+    reviewer_country,
+    review_date,
+    ingested_at
+from {{ source('landing', 'lnd_tp_reviews') }}